@@ -6,12 +6,17 @@ All AI calls go through this module. Claude models are configured in config.py.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Any
-
-import anthropic
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator
 
+import cache
 from config import get_settings
 from knowledge_base import build_knowledge_context, SLA, CONTACTS
 from models import (
@@ -27,61 +32,464 @@ from models import (
 )
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
-# Initialize Anthropic client — may be None if no API key
-_client = None
-if settings.anthropic_api_key:
+
+# Client construction (and the anthropic import itself) is deferred until a
+# code path actually calls Claude, keeping cold starts fast for workers that
+# only serve demo/mock traffic. Accessors return None when no key is set.
+
+@lru_cache(maxsize=1)
+def _get_client() -> "anthropic.Anthropic | None":
+    settings = get_settings()
+    if not settings.anthropic_api_key:
+        return None
+    import anthropic
+
+    try:
+        return anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_aclient() -> "anthropic.AsyncAnthropic | None":
+    settings = get_settings()
+    if not settings.anthropic_api_key:
+        return None
+    import anthropic
+
     try:
-        _client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        return anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
     except Exception:
-        _client = None
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_sem() -> asyncio.Semaphore:
+    """Bounds concurrent Claude calls so asyncio.gather over an inbox
+    doesn't exhaust the Anthropic rate limit."""
+    return asyncio.Semaphore(get_settings().claude_concurrency)
+
+
+# ── Single-flight coalescing ──────────────────────────────────────────────────
+# Under bursty load, several workers can fire the identical request before any
+# response lands in the cache; coalesce them so only one upstream call is paid.
+
+class _InflightCall:
+    """Result slot shared by concurrent callers of one request key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.text: str | None = None
+        self.error: Exception | None = None
+
+
+_sync_inflight: dict[str, _InflightCall] = {}
+_sync_inflight_lock = threading.Lock()
+
+_async_inflight: dict[str, asyncio.Future] = {}
+_async_inflight_lock = asyncio.Lock()
 
 
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
+# Direct value -> member tables skip Enum.__call__'s lookup machinery when
+# parsing thousands of batch results, and let unknown values fall back to a
+# sane default instead of raising and re-catching.
+_CAT = {m.value: m for m in TicketCategory}
+_PRI = {m.value: m for m in TicketPriority}
+_SENT = {m.value: m for m in SentimentLabel}
+_STATUS = {m.value: m for m in TicketStatus}
+
+def _tool_schema(name: str, model_cls: type, description: str) -> dict[str, Any]:
+    """Build an Anthropic tool definition from a Pydantic model's JSON schema."""
+    return {
+        "name": name,
+        "description": description,
+        "input_schema": model_cls.model_json_schema(),
+    }
+
+
+# Forcing Claude to "call" one of these tools guarantees a parseable JSON
+# payload — no markdown fences, no prose around the object.
+_CLASSIFY_TOOL = _tool_schema(
+    "record_classification",
+    TicketClassification,
+    "Record the classification of a support ticket.",
+)
+_RESPOND_TOOL = _tool_schema(
+    "record_response",
+    SuggestedResponse,
+    "Record the suggested customer service response.",
+)
+_HISTORY_TOOL = _tool_schema(
+    "record_history_summary",
+    CustomerHistorySummary,
+    "Record the client history summary.",
+)
+
+
+def _tool_choice(tool: dict[str, Any]) -> dict[str, str]:
+    return {"type": "tool", "name": tool["name"]}
+
+
+def _tool_result_text(message: Any, tool: dict[str, Any]) -> str:
+    """Extract the forced tool call's input as JSON text."""
+    for block in message.content:
+        if getattr(block, "type", None) == "tool_use" and block.name == tool["name"]:
+            return json.dumps(block.input)
+    raise ValueError(f"No {tool['name']} tool_use block in response")
+
+
+@lru_cache(maxsize=64)
+def _cached_kb(cats: frozenset[str] | None = None) -> str:
+    """
+    Memoized knowledge context. The context is deterministic in its category
+    set, so building it once per unique set saves the string assembly and
+    keeps prompts byte-identical across tickets — which is also what lets
+    the Anthropic prefix cache and the local caches hit.
+    """
+    return build_knowledge_context(categories=sorted(cats) if cats else None)
+
+
+def _system_blocks(system: str, knowledge: str | None) -> list[dict[str, Any]]:
+    """
+    Build the system parameter as content blocks marked with cache_control
+    so Anthropic reuses the tokenized prefix across requests. The knowledge
+    context rides as its own block: it is stable across tickets, so keeping
+    it out of the per-ticket user prompt maximizes server-side cache hits.
+    """
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+    ]
+    if knowledge:
+        blocks.append(
+            {"type": "text", "text": knowledge, "cache_control": {"type": "ephemeral"}}
+        )
+    return blocks
+
+
+def _cache_namespace(
+    system: str,
+    knowledge: str | None,
+    tool: dict[str, Any] | None = None,
+) -> str:
+    """Combined stable prefix used to key the local cache layers."""
+    namespace = system if not knowledge else f"{system}\n\n{knowledge}"
+    if tool is not None:
+        namespace = f"{namespace}\n[tool:{tool['name']}]"
+    return namespace
+
+
+def _semcache_allowed(system: str) -> bool:
+    """
+    Whether a prompt family may use semantic (near-match) caching.
+
+    Only classification is allowed: the bag-of-words embedding can score
+    two prompts that differ only in specifics (amounts, order IDs,
+    requester emails) above threshold. A near-match reply would carry
+    another ticket's details into an outgoing email, and a near-match
+    history summary would serve one customer's rolling summary to another
+    — and then persist it under the wrong customer via the history cache.
+    Classification tolerates a near-match; everything else does not, so
+    new prompt families stay excluded until opted in here.
+    """
+    return system == CLASSIFY_SYSTEM
+
+
 def _call_claude(
     system: str,
     user: str,
     model: str | None = None,
     max_tokens: int | None = None,
+    knowledge: str | None = None,
+    tool: dict[str, Any] | None = None,
+) -> str:
+    """
+    Low-level Claude call. Returns raw text content.
+
+    Identical prompts hit the exact-match cache, near-duplicates the
+    semantic cache (both in cache.py), before paying an Anthropic round-trip.
+    """
+    client = _get_client()
+    if client is None:
+        raise RuntimeError("Anthropic API key not configured")
+    model = model or get_settings().claude_model_respond
+    max_tokens = max_tokens or get_settings().claude_max_tokens
+
+    namespace = _cache_namespace(system, knowledge, tool)
+    cache_key = cache.hash_request(namespace, user, model, max_tokens)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if get_settings().semcache_enabled and _semcache_allowed(system):
+        cached = cache.semantic_lookup(namespace, user)
+        if cached is not None:
+            return cached
+
+    with _sync_inflight_lock:
+        entry = _sync_inflight.get(cache_key)
+        leader = entry is None
+        if leader:
+            entry = _InflightCall()
+            _sync_inflight[cache_key] = entry
+
+    if not leader:
+        entry.done.wait()
+        if entry.error is not None:
+            raise entry.error
+        return entry.text  # type: ignore[return-value]
+
+    kwargs: dict[str, Any] = {}
+    if tool is not None:
+        kwargs["tools"] = [tool]
+        kwargs["tool_choice"] = _tool_choice(tool)
+
+    try:
+        message = client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": user}],
+            system=_system_blocks(system, knowledge),
+            **kwargs,
+        )
+        text = _tool_result_text(message, tool) if tool is not None else message.content[0].text
+
+        cache.set(cache_key, text, model=model)
+        if get_settings().semcache_enabled and _semcache_allowed(system):
+            cache.semantic_store(namespace, user, text)
+        entry.text = text
+        return text
+    except Exception as exc:
+        entry.error = exc
+        raise
+    finally:
+        entry.done.set()
+        with _sync_inflight_lock:
+            _sync_inflight.pop(cache_key, None)
+
+
+# Give up after this many 429 retries (with the capped exponential delay,
+# ~1 minute of waiting) rather than spinning forever on a hard rate limit.
+_RATE_LIMIT_MAX_RETRIES = 5
+
+
+async def _acall_claude(
+    system: str,
+    user: str,
+    model: str | None = None,
+    max_tokens: int | None = None,
+    knowledge: str | None = None,
+    tool: dict[str, Any] | None = None,
 ) -> str:
-    """Low-level Claude call. Returns raw text content."""
-    if _client is None:
+    """
+    Async variant of _call_claude. Shares the same cache layers; concurrency
+    is capped by a semaphore and 429s are retried with backoff.
+    """
+    aclient = _get_aclient()
+    if aclient is None:
         raise RuntimeError("Anthropic API key not configured")
-    model = model or settings.claude_model_respond
-    max_tokens = max_tokens or settings.claude_max_tokens
+    model = model or get_settings().claude_model_respond
+    max_tokens = max_tokens or get_settings().claude_max_tokens
+
+    namespace = _cache_namespace(system, knowledge, tool)
+    cache_key = cache.hash_request(namespace, user, model, max_tokens)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if get_settings().semcache_enabled and _semcache_allowed(system):
+        cached = cache.semantic_lookup(namespace, user)
+        if cached is not None:
+            return cached
 
-    message = _client.messages.create(
+    async with _async_inflight_lock:
+        fut = _async_inflight.get(cache_key)
+        leader = fut is None
+        if leader:
+            fut = asyncio.get_running_loop().create_future()
+            _async_inflight[cache_key] = fut
+
+    if not leader:
+        return await fut
+
+    kwargs: dict[str, Any] = {}
+    if tool is not None:
+        kwargs["tools"] = [tool]
+        kwargs["tool_choice"] = _tool_choice(tool)
+
+    import anthropic
+
+    try:
+        async with _get_sem():
+            delay = 1.0
+            for attempt in range(_RATE_LIMIT_MAX_RETRIES + 1):
+                try:
+                    message = await aclient.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": user}],
+                        system=_system_blocks(system, knowledge),
+                        **kwargs,
+                    )
+                    break
+                except anthropic.RateLimitError:
+                    # Bounded: this loop holds a concurrency-semaphore slot,
+                    # so retrying forever on a persistent 429 would starve
+                    # every other Claude call in the process.
+                    if attempt == _RATE_LIMIT_MAX_RETRIES:
+                        raise
+                    logger.warning("Claude rate-limited; retrying in %.0fs", delay)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+        text = _tool_result_text(message, tool) if tool is not None else message.content[0].text
+
+        cache.set(cache_key, text, model=model)
+        if get_settings().semcache_enabled and _semcache_allowed(system):
+            cache.semantic_store(namespace, user, text)
+        fut.set_result(text)
+        return text
+    except Exception as exc:
+        if not fut.done():
+            fut.set_exception(exc)
+            # Awaited by followers; avoid "exception never retrieved" noise
+            # when there are none.
+            fut.exception()
+        raise
+    finally:
+        async with _async_inflight_lock:
+            _async_inflight.pop(cache_key, None)
+
+
+def _call_claude_stream(
+    system: str,
+    user: str,
+    model: str | None = None,
+    max_tokens: int | None = None,
+    knowledge: str | None = None,
+) -> Iterator[str]:
+    """
+    Streaming variant of _call_claude: yields text chunks as Claude emits
+    them, so a UI can render the draft before the message completes. The
+    assembled text is written to both cache layers when the stream ends.
+    Cache hits yield the full text as a single chunk.
+    """
+    client = _get_client()
+    if client is None:
+        raise RuntimeError("Anthropic API key not configured")
+    model = model or get_settings().claude_model_respond
+    max_tokens = max_tokens or get_settings().claude_max_tokens
+
+    namespace = _cache_namespace(system, knowledge)
+    cache_key = cache.hash_request(namespace, user, model, max_tokens)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks: list[str] = []
+    with client.messages.stream(
         model=model,
         max_tokens=max_tokens,
         messages=[{"role": "user", "content": user}],
-        system=system,
+        system=_system_blocks(system, knowledge),
+    ) as stream:
+        for chunk in stream.text_stream:
+            chunks.append(chunk)
+            yield chunk
+
+    text = "".join(chunks)
+    cache.set(cache_key, text, model=model)
+    if get_settings().semcache_enabled and _semcache_allowed(system):
+        cache.semantic_store(namespace, user, text)
+
+
+_BATCH_POLL_SECONDS = 5.0
+
+
+def _call_claude_batch(
+    requests: list[tuple[str, str, str, str | None]],
+    model: str | None = None,
+    max_tokens: int | None = None,
+    tool: dict[str, Any] | None = None,
+) -> dict[str, str]:
+    """
+    Submit (custom_id, system, user, knowledge) tuples through the Message
+    Batches API and poll until the batch ends. Returns custom_id -> raw text;
+    failed entries are simply absent so callers fall through to their error
+    paths.
+    """
+    client = _get_client()
+    if client is None:
+        raise RuntimeError("Anthropic API key not configured")
+    model = model or get_settings().claude_model_respond
+    max_tokens = max_tokens or get_settings().claude_max_tokens
+
+    extra: dict[str, Any] = {}
+    if tool is not None:
+        extra["tools"] = [tool]
+        extra["tool_choice"] = _tool_choice(tool)
+
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [{"role": "user", "content": user}],
+                    "system": _system_blocks(system, knowledge),
+                    **extra,
+                },
+            }
+            for custom_id, system, user, knowledge in requests
+        ]
     )
-    return message.content[0].text
+
+    while batch.processing_status != "ended":
+        time.sleep(_BATCH_POLL_SECONDS)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    results: dict[str, str] = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            message = entry.result.message
+            results[entry.custom_id] = (
+                _tool_result_text(message, tool) if tool is not None
+                else message.content[0].text
+            )
+        else:
+            logger.warning(
+                "Batch entry %s did not succeed: %s", entry.custom_id, entry.result.type
+            )
+    return results
+
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+_JSON_DECODER = json.JSONDecoder()
 
 
 def _parse_json_response(text: str) -> dict[str, Any]:
     """
     Extract JSON from Claude's response. Handles markdown code fences.
     Raises ValueError if no valid JSON found.
-    """
-    text = text.strip()
 
-    # Strip markdown code fences if present
-    if text.startswith("```"):
-        lines = text.splitlines()
-        text = "\n".join(
-            line for line in lines if not line.startswith("```")
-        ).strip()
+    raw_decode parses in a single pass from the first brace, which also
+    handles braces nested inside string values that a find/rfind slice
+    would mis-handle.
+    """
+    text = _FENCE.sub("", text).strip()
 
-    # Find outermost JSON object
     start = text.find("{")
-    end = text.rfind("}") + 1
-    if start == -1 or end == 0:
+    if start < 0:
         raise ValueError(f"No JSON object found in response: {text[:200]}")
 
-    return json.loads(text[start:end])
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON in response: {exc}") from exc
+    return obj
 
 
 # ── Ticket Classification ─────────────────────────────────────────────────────
@@ -121,39 +529,59 @@ Escalation triggers (set should_escalate=true):
 """
 
 
-def classify_ticket(ticket: ZendeskTicket) -> TicketClassification:
-    """Classify a Zendesk ticket using Claude."""
-    knowledge = build_knowledge_context()
+# User-prompt templates are module-level constants rendered via format_map:
+# the template string is parsed once at import, and rendering only fills the
+# variable slots — the per-ticket tail stays byte-stable for caching.
 
-    user_prompt = f"""
+_CLASSIFY_USER_TMPL = """
 Classify this Luxor Workspaces support ticket.
 
-TICKET ID: {ticket.id}
-SUBJECT: {ticket.subject}
+TICKET ID: {ticket_id}
+SUBJECT: {subject}
 DESCRIPTION:
-{ticket.description or "(no description provided)"}
+{description}
 
-EXISTING PRIORITY: {ticket.priority}
-EXISTING STATUS: {ticket.status}
-TAGS: {", ".join(ticket.tags) if ticket.tags else "none"}
+EXISTING PRIORITY: {priority}
+EXISTING STATUS: {status}
+TAGS: {tags}
+{hint}"""
 
-KNOWLEDGE BASE CONTEXT:
-{knowledge}
-"""
 
-    raw = _call_claude(
-        system=CLASSIFY_SYSTEM,
-        user=user_prompt,
-        model=settings.claude_model_classify,
+def _build_classify_prompt(
+    ticket: ZendeskTicket,
+    escalation_hit: str | None = None,
+) -> str:
+    """
+    Build the user prompt for ticket classification. Knowledge context is
+    passed separately (as a cached system block), keeping this prompt small
+    and purely per-ticket.
+    """
+    hint = (
+        f'\nPre-detected escalation signal: "{escalation_hit}" '
+        "(should_escalate is already confirmed — focus on the remaining fields).\n"
+        if escalation_hit
+        else ""
     )
-
+    return _CLASSIFY_USER_TMPL.format_map({
+        "ticket_id": ticket.id,
+        "subject": ticket.subject,
+        "description": ticket.description or "(no description provided)",
+        "priority": ticket.priority,
+        "status": ticket.status,
+        "tags": ", ".join(ticket.tags) if ticket.tags else "none",
+        "hint": hint,
+    })
+
+
+def _classification_from_raw(ticket: ZendeskTicket, raw: str) -> TicketClassification:
+    """Parse Claude's raw classification text into a model, with safe fallback."""
     try:
         data = _parse_json_response(raw)
         return TicketClassification(
             ticket_id=ticket.id,
-            category=TicketCategory(data["category"]),
-            priority=TicketPriority(data["priority"]),
-            sentiment=SentimentLabel(data["sentiment"]),
+            category=_CAT.get(data["category"], TicketCategory.general),
+            priority=_PRI.get(data["priority"], TicketPriority.normal),
+            sentiment=_SENT.get(data["sentiment"], SentimentLabel.neutral),
             should_escalate=bool(data["should_escalate"]),
             escalation_reason=data.get("escalation_reason"),
             confidence=float(data.get("confidence", 0.85)),
@@ -173,6 +601,495 @@ KNOWLEDGE BASE CONTEXT:
         )
 
 
+def _escalation_hit_for(ticket: ZendeskTicket) -> str | None:
+    return _scan_escalation_triggers(f"{ticket.subject}\n{ticket.description or ''}")
+
+
+def _apply_escalation_hit(
+    result: TicketClassification,
+    hit: str | None,
+) -> TicketClassification:
+    """Deterministic triggers override whatever Claude concluded."""
+    if hit is not None and not result.should_escalate:
+        result.should_escalate = True
+        result.escalation_reason = f'Matched escalation trigger: "{hit}"'
+    return result
+
+
+# ── Prototype fast path ──────────────────────────────────────────────────────
+# Most tickets are obvious from subject keywords; match them against canonical
+# per-category prototypes locally and only pay for Claude on ambiguous ones.
+# Escalation-worthy nuance still goes to Claude: the fast path never fires on
+# tickets carrying urgent/escalation language.
+
+_CATEGORY_PROTOTYPES: dict[TicketCategory, list[str]] = {
+    TicketCategory.billing: [
+        "incorrect charge on my invoice billing dispute overcharge",
+        "invoice does not match purchase order need credit memo",
+        "payment failed card declined update billing method",
+        "question about my monthly membership bill charges",
+    ],
+    TicketCategory.access: [
+        "key card not working cannot get into the building",
+        "sso login loop cannot sign in to the portal password reset",
+        "new user provisioning request add users to the portal",
+        "access hours question after hours entry",
+    ],
+    TicketCategory.maintenance: [
+        "air conditioning broken hvac too hot too cold in office",
+        "printer not working paper jam replace toner",
+        "wifi slow network connectivity problems in the workspace",
+        "light fixture flickering plumbing leak in restroom",
+    ],
+    TicketCategory.booking: [
+        "book a conference room for a meeting next week",
+        "reschedule my room reservation change booking time",
+        "recurring conference room booking setup",
+    ],
+    TicketCategory.lease: [
+        "membership agreement renewal terms question",
+        "cancel my membership notice period downgrade plan",
+        "upgrade from hot desk to private office pricing",
+    ],
+    TicketCategory.amenities: [
+        "coffee machine empty kitchen supplies restock",
+        "mail and package handling question front desk",
+        "guest policy bringing visitors to the workspace",
+    ],
+    TicketCategory.orders: [
+        "where is my order tracking number shipping status",
+        "modify or cancel my order placed yesterday",
+        "order has not arrived missing delivery",
+    ],
+    TicketCategory.warranty: [
+        "file a warranty claim broken chair desk defect",
+        "replacement under warranty manufacturing defect",
+    ],
+}
+
+_URGENT_RE = re.compile(
+    r"\b(urgent|emergency|outage|asap|immediately|critical|safety)\b", re.IGNORECASE
+)
+
+# Deterministic escalation triggers, mirroring SLA["escalation_triggers"].
+# Scanned locally as one precompiled multi-pattern regex (single C-level DFA
+# pass over the text) so Claude never misses the black-and-white cases.
+_ESCALATION_TRIGGERS: tuple[str, ...] = (
+    "cancel",
+    "terminate",
+    "lawyer",
+    "attorney",
+    "lawsuit",
+    "legal action",
+    "sue you",
+    "competitor",
+    "switching to",
+    "press",
+    "media",
+    "journalist",
+    "outage",
+    "emergency",
+    "safety hazard",
+    "security breach",
+    "unacceptable",
+    "second time",
+    "again and again",
+)
+_ESCALATION_RE = re.compile(
+    "|".join(
+        rf"\b{re.escape(p)}\b"
+        for p in sorted(_ESCALATION_TRIGGERS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _scan_escalation_triggers(text: str) -> str | None:
+    """Return the first deterministic escalation trigger found, else None."""
+    match = _ESCALATION_RE.search(text)
+    return match.group(0).lower() if match else None
+
+_PROTOTYPE_INDEX: list[tuple[TicketCategory, list[float]]] = [
+    (category, cache.embed(phrase))
+    for category, phrases in _CATEGORY_PROTOTYPES.items()
+    for phrase in phrases
+]
+
+
+def _fastpath_classification(ticket: ZendeskTicket) -> TicketClassification | None:
+    """
+    Nearest-prototype classification. Returns None (fall through to Claude)
+    unless a prototype clears Settings.classify_fastpath_threshold and the
+    ticket shows no escalation language.
+    """
+    if not get_settings().classify_fastpath_enabled:
+        return None
+
+    text = f"{ticket.subject}\n{ticket.description or ''}"
+    if _scan_escalation_triggers(text) is not None:
+        return None
+
+    query = cache.embed(text)
+    best_score = 0.0
+    best_category: TicketCategory | None = None
+    for category, prototype in _PROTOTYPE_INDEX:
+        score = cache.cosine(query, prototype)
+        if score > best_score:
+            best_score = score
+            best_category = category
+
+    if best_category is None or best_score < get_settings().classify_fastpath_threshold:
+        return None
+
+    priority = (
+        TicketPriority.urgent if _URGENT_RE.search(text) else TicketPriority.normal
+    )
+    logger.debug(
+        "Fast-path classified ticket %s as %s (score=%.3f)",
+        ticket.id, best_category.value, best_score,
+    )
+    return TicketClassification(
+        ticket_id=ticket.id,
+        category=best_category,
+        priority=priority,
+        sentiment=SentimentLabel.neutral,
+        should_escalate=False,
+        confidence=round(best_score, 2),
+        summary=f"Auto-classified as {best_category.value} by prototype similarity.",
+    )
+
+
+def _needs_rerun(result: TicketClassification) -> bool:
+    """
+    Whether a cheap-model classification should be retried on the stronger
+    respond model: confidence is low but nonzero (zero means the call
+    failed outright and a retry would fail the same way), and the two
+    models actually differ.
+    """
+    settings = get_settings()
+    return (
+        0.0 < result.confidence < settings.classify_rerun_confidence
+        and settings.claude_model_classify != settings.claude_model_respond
+    )
+
+
+async def _aclassify_rerun(
+    ticket: ZendeskTicket, hit: str | None
+) -> TicketClassification:
+    """Re-run one low-confidence classification on the respond model."""
+    raw = await _acall_claude(
+        system=CLASSIFY_SYSTEM,
+        user=_build_classify_prompt(ticket, escalation_hit=hit),
+        model=get_settings().claude_model_respond,
+        knowledge=_cached_kb(),
+        tool=_CLASSIFY_TOOL,
+    )
+    return _classification_from_raw(ticket, raw)
+
+
+def classify_ticket(ticket: ZendeskTicket) -> TicketClassification:
+    """
+    Classify a Zendesk ticket using Claude.
+
+    Obvious tickets short-circuit through the local prototype fast path.
+    Otherwise runs on the cheap classify model first; if that comes back
+    with low confidence (and didn't fail outright), the ticket is re-run
+    on the stronger respond model.
+    """
+    fastpath = _fastpath_classification(ticket)
+    if fastpath is not None:
+        return fastpath
+
+    hit = _escalation_hit_for(ticket)
+    raw = _call_claude(
+        system=CLASSIFY_SYSTEM,
+        user=_build_classify_prompt(ticket, escalation_hit=hit),
+        model=get_settings().claude_model_classify,
+        knowledge=_cached_kb(),
+        tool=_CLASSIFY_TOOL,
+    )
+    result = _classification_from_raw(ticket, raw)
+
+    if _needs_rerun(result):
+        logger.info(
+            "Low-confidence classification (%.2f) for ticket %s — re-running on %s",
+            result.confidence, ticket.id, get_settings().claude_model_respond,
+        )
+        raw = _call_claude(
+            system=CLASSIFY_SYSTEM,
+            user=_build_classify_prompt(ticket, escalation_hit=hit),
+            model=get_settings().claude_model_respond,
+            knowledge=_cached_kb(),
+            tool=_CLASSIFY_TOOL,
+        )
+        result = _classification_from_raw(ticket, raw)
+    return _apply_escalation_hit(result, hit)
+
+
+async def aclassify_ticket(ticket: ZendeskTicket) -> TicketClassification:
+    """
+    Async variant of classify_ticket, including the same low-confidence
+    re-run on the stronger respond model.
+    """
+    fastpath = _fastpath_classification(ticket)
+    if fastpath is not None:
+        return fastpath
+
+    hit = _escalation_hit_for(ticket)
+    raw = await _acall_claude(
+        system=CLASSIFY_SYSTEM,
+        user=_build_classify_prompt(ticket, escalation_hit=hit),
+        model=get_settings().claude_model_classify,
+        knowledge=_cached_kb(),
+        tool=_CLASSIFY_TOOL,
+    )
+    result = _classification_from_raw(ticket, raw)
+
+    if _needs_rerun(result):
+        logger.info(
+            "Low-confidence classification (%.2f) for ticket %s — re-running on %s",
+            result.confidence, ticket.id, get_settings().claude_model_respond,
+        )
+        result = await _aclassify_rerun(ticket, hit)
+    return _apply_escalation_hit(result, hit)
+
+
+async def classify_tickets(tickets: list[ZendeskTicket]) -> list[TicketClassification]:
+    """Classify tickets concurrently (bounded by Settings.claude_concurrency)."""
+    return list(await asyncio.gather(*(aclassify_ticket(t) for t in tickets)))
+
+
+def classify_tickets_batch(tickets: list[ZendeskTicket]) -> list[TicketClassification]:
+    """
+    Classify many tickets via the Anthropic Message Batches API.
+
+    Batches are ~50% cheaper than interactive calls and avoid N sequential
+    round-trips — use this for backlog reprocessing, not webhook handling.
+    Results come back in the same order as `tickets`.
+    """
+    if not tickets:
+        return []
+
+    fastpath = {t.id: _fastpath_classification(t) for t in tickets}
+    remaining = [t for t in tickets if fastpath[t.id] is None]
+    hits = {t.id: _escalation_hit_for(t) for t in remaining}
+
+    # Duplicate content (form submissions, auto-generated alerts) shares one
+    # batch entry; the result is fanned back out to every ticket in a bucket.
+    buckets: dict[str, list[ZendeskTicket]] = {}
+    for t in remaining:
+        content_key = hashlib.sha1(
+            (t.subject + (t.description or "")).encode()
+        ).hexdigest()
+        buckets.setdefault(content_key, []).append(t)
+    representatives = [bucket[0] for bucket in buckets.values()]
+
+    results: dict[str, str] = {}
+    if representatives:
+        knowledge = _cached_kb()
+        results = _call_claude_batch(
+            [
+                (
+                    str(t.id),
+                    CLASSIFY_SYSTEM,
+                    _build_classify_prompt(t, escalation_hit=hits[t.id]),
+                    knowledge,
+                )
+                for t in representatives
+            ],
+            model=get_settings().claude_model_classify,
+            tool=_CLASSIFY_TOOL,
+        )
+
+    by_ticket: dict[int, TicketClassification] = {}
+    for bucket in buckets.values():
+        rep = bucket[0]
+        rep_result = _apply_escalation_hit(
+            _classification_from_raw(rep, results.get(str(rep.id), "")), hits[rep.id]
+        )
+        for t in bucket:
+            by_ticket[t.id] = (
+                rep_result if t.id == rep.id
+                else rep_result.model_copy(update={"ticket_id": t.id})
+            )
+
+    return [fastpath[t.id] or by_ticket[t.id] for t in tickets]
+
+
+# ── Classification Micro-Batching ─────────────────────────────────────────────
+
+# Coalescing window and cap for bursty interactive classification traffic.
+_COALESCE_WINDOW_SECONDS = 0.03
+_COALESCE_MAX_ITEMS = 16
+
+_MULTI_CLASSIFY_HEADER = (
+    "Classify each of the {n} Luxor Workspaces support tickets below.\n"
+    "Respond ONLY with a JSON array of {n} classification objects, in the "
+    "same order as the tickets — no commentary, no markdown.\n\n"
+)
+
+
+def _parse_json_array(text: str, expected: int) -> list[str]:
+    """
+    Extract a JSON array from Claude's response and return each element
+    re-serialized, so the per-ticket parser (with its safe fallback) can
+    treat every entry like a single-classification reply.
+    """
+    text = _FENCE.sub("", text).strip()
+    start = text.find("[")
+    if start < 0:
+        raise ValueError(f"No JSON array found in response: {text[:200]}")
+    entries, _ = _JSON_DECODER.raw_decode(text, start)
+    if not isinstance(entries, list) or len(entries) != expected:
+        raise ValueError(
+            f"Expected {expected} classifications, got "
+            f"{len(entries) if isinstance(entries, list) else type(entries).__name__}"
+        )
+    return [json.dumps(entry) for entry in entries]
+
+
+class ClassifyBatcher:
+    """
+    Coalesce concurrent classification calls into one Claude request.
+
+    Submissions landing within a ~30 ms window are drained together and
+    sent as a single numbered prompt; the JSON-array reply is demultiplexed
+    back to each awaiting caller. Fast-path hits (demo mode, keyword
+    triage) resolve immediately and never queue, and a window holding a
+    single ticket just delegates to aclassify_ticket. A burst of N tickets
+    pays one round-trip and one system-prompt prefix instead of N.
+    """
+
+    def __init__(
+        self,
+        window: float = _COALESCE_WINDOW_SECONDS,
+        max_items: int = _COALESCE_MAX_ITEMS,
+    ) -> None:
+        self._window = window
+        self._max_items = max_items
+        self._pending: list[
+            tuple[ZendeskTicket, asyncio.Future[TicketClassification]]
+        ] = []
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def submit(self, ticket: ZendeskTicket) -> TicketClassification:
+        fastpath = _fastpath_classification(ticket)
+        if fastpath is not None:
+            return fastpath
+
+        future: asyncio.Future[TicketClassification] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.append((ticket, future))
+        if len(self._pending) >= self._max_items:
+            self._flush()
+        elif self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    def _flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._window)
+        self._flusher = None
+        batch, self._pending = self._pending, []
+        if batch:
+            await self._run_batch(batch)
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[ZendeskTicket, asyncio.Future[TicketClassification]]],
+    ) -> None:
+        if len(batch) == 1:
+            ticket, future = batch[0]
+            try:
+                future.set_result(await aclassify_ticket(ticket))
+            except Exception as exc:
+                future.set_exception(exc)
+            return
+
+        tickets = [t for t, _ in batch]
+        hits = [_escalation_hit_for(t) for t in tickets]
+        numbered = "\n\n".join(
+            f"--- TICKET {i + 1} of {len(tickets)} ---\n"
+            + _build_classify_prompt(t, escalation_hit=hit)
+            for i, (t, hit) in enumerate(zip(tickets, hits))
+        )
+        try:
+            raw = await _acall_claude(
+                system=CLASSIFY_SYSTEM,
+                user=_MULTI_CLASSIFY_HEADER.format(n=len(tickets)) + numbered,
+                model=get_settings().claude_model_classify,
+                knowledge=_cached_kb(),
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        try:
+            entries = _parse_json_array(raw, len(tickets))
+        except ValueError:
+            # The batched prompt can't force a tool call the way the
+            # single-ticket path does, so a malformed or miscounted array is
+            # possible. Degrade to per-ticket calls — which keep the safe
+            # fallback in _classification_from_raw — instead of failing
+            # every coalesced caller over one bad reply.
+            logger.warning(
+                "Batched classify reply unparseable for %d tickets; "
+                "falling back to per-ticket calls", len(tickets),
+            )
+            results = await asyncio.gather(
+                *(aclassify_ticket(t) for t in tickets), return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            return
+
+        reruns: list[tuple[ZendeskTicket, asyncio.Future[TicketClassification], str | None]] = []
+        for (ticket, future), entry, hit in zip(batch, entries, hits):
+            result = _classification_from_raw(ticket, entry)
+            if _needs_rerun(result):
+                reruns.append((ticket, future, hit))
+                continue
+            if not future.done():
+                future.set_result(_apply_escalation_hit(result, hit))
+
+        if not reruns:
+            return
+        logger.info(
+            "Re-running %d low-confidence batched classification(s) on %s",
+            len(reruns), get_settings().claude_model_respond,
+        )
+        results = await asyncio.gather(
+            *(_aclassify_rerun(t, h) for t, _, h in reruns),
+            return_exceptions=True,
+        )
+        for (ticket, future, hit), result in zip(reruns, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(_apply_escalation_hit(result, hit))
+
+
+# Shared batcher for the interactive classify endpoints.
+classify_batcher = ClassifyBatcher()
+
+
 # ── Response Generation ───────────────────────────────────────────────────────
 
 RESPOND_SYSTEM = """
@@ -201,50 +1118,80 @@ Response guidelines:
 """
 
 
-def generate_ticket_response(
-    ticket: ZendeskTicket,
-    classification: TicketClassification,
-    requester_name: str | None = None,
-) -> SuggestedResponse:
-    """Generate a suggested response for a Zendesk ticket."""
-    knowledge = build_knowledge_context(
-        categories=[classification.category.value] if classification.category else None
+def _respond_knowledge(classification: TicketClassification | None) -> str:
+    """Knowledge context scoped to the classified category."""
+    return _cached_kb(
+        frozenset({classification.category.value}) if classification else None
     )
 
-    user_prompt = f"""
+
+_RESPOND_USER_TMPL = """
 Generate a customer service response for this Luxor Workspaces support ticket.
 
-TICKET ID: {ticket.id}
-SUBJECT: {ticket.subject}
-FROM: {requester_name or "Member"}
+TICKET ID: {ticket_id}
+SUBJECT: {subject}
+FROM: {requester}
 DESCRIPTION:
-{ticket.description or "(no description provided)"}
+{description}
 
 CLASSIFICATION:
-- Category: {classification.category.value}
-- Priority: {classification.priority.value}
-- Sentiment: {classification.sentiment.value}
-- Should Escalate: {classification.should_escalate}
-- Summary: {classification.summary}
+- Category: {category}
+- Priority: {priority}
+- Sentiment: {sentiment}
+- Should Escalate: {should_escalate}
+- Summary: {summary}
 
-ESCALATION CONTACT (if needed): {CONTACTS["escalation"]}
-
-KNOWLEDGE BASE:
-{knowledge}
+ESCALATION CONTACT (if needed): {escalation_contact}
 
 Write a response that directly addresses the client's issue.
-{"IMPORTANT: This ticket should be escalated. Acknowledge the urgency and let the client know you are connecting them with a senior team member." if classification.should_escalate else ""}
+{escalation_note}
 """
 
-    raw = _call_claude(system=RESPOND_SYSTEM, user=user_prompt)
+_ESCALATION_NOTE = (
+    "IMPORTANT: This ticket should be escalated. Acknowledge the urgency and "
+    "let the client know you are connecting them with a senior team member."
+)
+
 
+def _build_respond_prompt(
+    ticket: ZendeskTicket,
+    classification: TicketClassification,
+    requester_name: str | None = None,
+) -> str:
+    """
+    Build the user prompt for ticket response generation. Knowledge context
+    is passed separately (as a cached system block).
+    """
+    return _RESPOND_USER_TMPL.format_map({
+        "ticket_id": ticket.id,
+        "subject": ticket.subject,
+        "requester": requester_name or "Member",
+        "description": ticket.description or "(no description provided)",
+        "category": classification.category.value,
+        "priority": classification.priority.value,
+        "sentiment": classification.sentiment.value,
+        "should_escalate": classification.should_escalate,
+        "summary": classification.summary,
+        "escalation_contact": CONTACTS["escalation"],
+        "escalation_note": _ESCALATION_NOTE if classification.should_escalate else "",
+    })
+
+
+def _response_from_raw(
+    ticket: ZendeskTicket,
+    raw: str,
+    requester_name: str | None = None,
+) -> SuggestedResponse:
+    """Parse Claude's raw response text into a model, with safe fallback."""
     try:
         data = _parse_json_response(raw)
         return SuggestedResponse(
             ticket_id=ticket.id,
             subject=data["subject"],
             body=data["body"],
-            suggested_status=TicketStatus(data.get("suggested_status", "pending")),
+            suggested_status=_STATUS.get(
+                data.get("suggested_status"), TicketStatus.pending
+            ),
             suggested_tags=data.get("suggested_tags", []),
             internal_notes=data.get("internal_notes"),
         )
@@ -263,41 +1210,163 @@ Write a response that directly addresses the client's issue.
         )
 
 
-# ── Email Response Generation ─────────────────────────────────────────────────
+def generate_ticket_response(
+    ticket: ZendeskTicket,
+    classification: TicketClassification,
+    requester_name: str | None = None,
+) -> SuggestedResponse:
+    """Generate a suggested response for a Zendesk ticket."""
+    raw = _call_claude(
+        system=RESPOND_SYSTEM,
+        user=_build_respond_prompt(ticket, classification, requester_name),
+        knowledge=_respond_knowledge(classification),
+        tool=_RESPOND_TOOL,
+    )
+    return _response_from_raw(ticket, raw, requester_name)
 
-def generate_email_response(
-    email: InboundEmail,
-    classification: TicketClassification | None = None,
+
+async def agenerate_ticket_response(
+    ticket: ZendeskTicket,
+    classification: TicketClassification,
+    requester_name: str | None = None,
 ) -> SuggestedResponse:
-    """Generate a draft response for an inbound customer email."""
-    knowledge = build_knowledge_context(
-        categories=[classification.category.value] if classification else None
+    """Async variant of generate_ticket_response."""
+    raw = await _acall_claude(
+        system=RESPOND_SYSTEM,
+        user=_build_respond_prompt(ticket, classification, requester_name),
+        knowledge=_respond_knowledge(classification),
+        tool=_RESPOND_TOOL,
     )
+    return _response_from_raw(ticket, raw, requester_name)
 
-    user_prompt = f"""
+
+def generate_ticket_response_stream(
+    ticket: ZendeskTicket,
+    classification: TicketClassification,
+    requester_name: str | None = None,
+) -> Iterator[str]:
+    """
+    Stream a suggested response as raw text chunks. The stream carries the
+    JSON body Claude produces; callers accumulate and feed the full text to
+    _parse_json_response (or just surface the chunks to the UI).
+    """
+    return _call_claude_stream(
+        system=RESPOND_SYSTEM,
+        user=_build_respond_prompt(ticket, classification, requester_name),
+        knowledge=_respond_knowledge(classification),
+    )
+
+
+async def agenerate_ticket_response_stream(
+    ticket: ZendeskTicket,
+    classification: TicketClassification,
+    requester_name: str | None = None,
+) -> AsyncIterator[str]:
+    """Async variant of generate_ticket_response_stream for the API layer."""
+    aclient = _get_aclient()
+    if aclient is None:
+        raise RuntimeError("Anthropic API key not configured")
+
+    system = RESPOND_SYSTEM
+    user = _build_respond_prompt(ticket, classification, requester_name)
+    knowledge = _respond_knowledge(classification)
+    model = get_settings().claude_model_respond
+    max_tokens = get_settings().claude_max_tokens
+
+    namespace = _cache_namespace(system, knowledge)
+    cache_key = cache.hash_request(namespace, user, model, max_tokens)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks: list[str] = []
+    async with _get_sem():
+        async with aclient.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": user}],
+            system=_system_blocks(system, knowledge),
+        ) as stream:
+            async for chunk in stream.text_stream:
+                chunks.append(chunk)
+                yield chunk
+
+    text = "".join(chunks)
+    cache.set(cache_key, text, model=model)
+    if get_settings().semcache_enabled and _semcache_allowed(system):
+        cache.semantic_store(namespace, user, text)
+
+
+def generate_ticket_responses_batch(
+    tickets: list[ZendeskTicket],
+    classifications: list[TicketClassification],
+) -> list[SuggestedResponse]:
+    """
+    Generate responses for many (ticket, classification) pairs via the
+    Message Batches API. Results come back in the same order as `tickets`.
+    """
+    if not tickets:
+        return []
+
+    results = _call_claude_batch(
+        [
+            (str(t.id), RESPOND_SYSTEM, _build_respond_prompt(t, c), _respond_knowledge(c))
+            for t, c in zip(tickets, classifications)
+        ],
+        tool=_RESPOND_TOOL,
+    )
+    return [
+        _response_from_raw(t, results.get(str(t.id), ""))
+        for t in tickets
+    ]
+
+
+# ── Email Response Generation ─────────────────────────────────────────────────
+
+_EMAIL_USER_TMPL = """
 Generate a customer service email response for this inbound message to Luxor Workspaces.
 
-FROM: {email.sender_name or email.sender_email}
-SUBJECT: {email.subject}
+FROM: {sender}
+SUBJECT: {subject}
 MESSAGE:
-{email.body_text}
-
-{"CLASSIFICATION: " + classification.model_dump_json() if classification else ""}
+{body}
 
-KNOWLEDGE BASE:
-{knowledge}
+{classification}
 
 Write a warm, professional email response addressing the inquiry directly.
 """
 
-    raw = _call_claude(system=RESPOND_SYSTEM, user=user_prompt)
+def generate_email_response(
+    email: InboundEmail,
+    classification: TicketClassification | None = None,
+) -> SuggestedResponse:
+    """Generate a draft response for an inbound customer email."""
+    user_prompt = _EMAIL_USER_TMPL.format_map({
+        "sender": email.sender_name or email.sender_email,
+        "subject": email.subject,
+        "body": email.body_text,
+        "classification": (
+            "CLASSIFICATION: " + classification.model_dump_json()
+            if classification else ""
+        ),
+    })
+
+    raw = _call_claude(
+        system=RESPOND_SYSTEM,
+        user=user_prompt,
+        knowledge=_respond_knowledge(classification),
+        tool=_RESPOND_TOOL,
+    )
 
     try:
         data = _parse_json_response(raw)
         return SuggestedResponse(
             subject=data["subject"],
             body=data["body"],
-            suggested_status=TicketStatus(data.get("suggested_status", "pending")),
+            suggested_status=_STATUS.get(
+                data.get("suggested_status"), TicketStatus.pending
+            ),
             suggested_tags=data.get("suggested_tags", []),
             internal_notes=data.get("internal_notes"),
         )
@@ -356,9 +1425,34 @@ def summarize_customer_history(
         if t.status in (TicketStatus.new, TicketStatus.open, TicketStatus.pending)
     )
 
+    # Incremental summarization: reuse the stored rolling summary and only
+    # send Claude the tickets that arrived since the last watermark.
+    cached = cache.get_history(requester_email)
+    previous_summary: str | None = None
+    new_tickets = tickets
+    if cached is not None:
+        data, last_ticket_id = cached
+        previous_summary = data.get("summary")
+        new_tickets = [t for t in tickets if t.id > last_ticket_id]
+        if not new_tickets:
+            return CustomerHistorySummary(
+                requester_email=requester_email,
+                total_tickets=len(tickets),
+                open_tickets=open_count,
+                avg_sentiment=data.get("avg_sentiment", "neutral"),
+                top_categories=data.get("top_categories", []),
+                summary=previous_summary or "",
+                vip_flag=bool(data.get("vip_flag", False)),
+            )
+
     ticket_summaries = "\n".join(
         f"- [{t.id}] {t.subject} | status={t.status.value} | priority={t.priority or 'none'}"
-        for t in tickets[:30]  # cap to avoid token overflow
+        for t in new_tickets[:30]  # cap to avoid token overflow
+    )
+    previous_section = (
+        f"\nPREVIOUS SUMMARY (fold this into your assessment):\n{previous_summary}\n"
+        if previous_summary
+        else ""
     )
 
     user_prompt = f"""
@@ -367,18 +1461,23 @@ Summarize the ticket history for this Luxor Workspaces client.
 EMAIL: {requester_email}
 TOTAL TICKETS: {len(tickets)}
 OPEN TICKETS: {open_count}
-
-TICKET LIST:
+{previous_section}
+{"NEW TICKETS SINCE LAST SUMMARY:" if previous_summary else "TICKET LIST:"}
 {ticket_summaries}
 
 Provide an honest assessment of their experience and flag if they should be treated as VIP.
 """
 
-    raw = _call_claude(system=HISTORY_SYSTEM, user=user_prompt)
+    raw = _call_claude(
+        system=HISTORY_SYSTEM,
+        user=user_prompt,
+        model=get_settings().claude_model_summarize,
+        tool=_HISTORY_TOOL,
+    )
 
     try:
         data = _parse_json_response(raw)
-        return CustomerHistorySummary(
+        result = CustomerHistorySummary(
             requester_email=requester_email,
             total_tickets=len(tickets),
             open_tickets=open_count,
@@ -387,6 +1486,17 @@ Provide an honest assessment of their experience and flag if they should be trea
             summary=data["summary"],
             vip_flag=bool(data.get("vip_flag", False)),
         )
+        cache.set_history(
+            requester_email,
+            {
+                "summary": result.summary,
+                "avg_sentiment": result.avg_sentiment,
+                "top_categories": result.top_categories,
+                "vip_flag": result.vip_flag,
+            },
+            max(t.id for t in tickets),
+        )
+        return result
     except (ValueError, KeyError, json.JSONDecodeError) as exc:
         logger.error("Failed to parse history summary: %s | raw: %s", exc, raw[:300])
         return CustomerHistorySummary(
@@ -0,0 +1,268 @@
+"""
+cache.py — Response caching for Claude calls.
+
+Provides a semantic cache so near-duplicate prompts (paraphrased tickets,
+re-submitted forms) are answered from a local store instead of paying the
+full Anthropic round-trip. Entries are namespaced by a hash of the system
+prompt so classification and response-generation caches never cross-pollute.
+
+Two layers, checked in order:
+  1. Exact cache — SHA-256 over NFC-normalized (system, user, model,
+     max_tokens). Microsecond hash vs a multi-second API call; catches
+     retries and repeated test fixtures byte-for-byte.
+  2. Semantic cache — hashed bag-of-words embedding (pure stdlib, no model
+     download) with cosine similarity above Settings.semcache_threshold.
+
+Both layers persist to SQLite so cache state survives restarts. Exact
+entries carry a TTL and are LRU-evicted past Settings.cache_max_entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_EMBED_DIM = 256
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+_db_lock = threading.Lock()
+_db: sqlite3.Connection | None = None
+
+# In-memory index: namespace -> list of (embedding, response_text)
+_semantic_index: dict[str, list[tuple[list[float], str]]] = {}
+
+
+# ── SQLite persistence ───────────────────────────────────────────────────────
+
+def _get_db() -> sqlite3.Connection:
+    global _db
+    if _db is None:
+        _db = sqlite3.connect(settings.cache_db_path, check_same_thread=False)
+        _db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS semantic_cache (
+                namespace TEXT NOT NULL,
+                embedding TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+            """
+        )
+        _db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS exact_cache (
+                key TEXT PRIMARY KEY,
+                text BLOB NOT NULL,
+                model TEXT,
+                created_at INTEGER NOT NULL
+            )
+            """
+        )
+        _db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS history_cache (
+                requester_email TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                last_ticket_id INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+            """
+        )
+        _db.commit()
+    return _db
+
+
+def _load_namespace(namespace: str) -> list[tuple[list[float], str]]:
+    """Lazily pull a namespace's entries from SQLite into the in-memory index."""
+    if namespace not in _semantic_index:
+        db = _get_db()
+        rows = db.execute(
+            "SELECT embedding, response FROM semantic_cache WHERE namespace = ?",
+            (namespace,),
+        ).fetchall()
+        _semantic_index[namespace] = [
+            (json.loads(embedding), response) for embedding, response in rows
+        ]
+    return _semantic_index[namespace]
+
+
+# ── Embedding ────────────────────────────────────────────────────────────────
+
+def _embed(text: str) -> list[float]:
+    """
+    Hashed bag-of-words embedding: each token is hashed into a fixed-size
+    vector, then L2-normalized. Crude compared to a transformer model, but
+    fast, dependency-free, and good enough to match paraphrased tickets.
+    """
+    vec = [0.0] * _EMBED_DIM
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode(), digest_size=4).digest()
+        vec[int.from_bytes(digest, "big") % _EMBED_DIM] += 1.0
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm:
+        vec = [v / norm for v in vec]
+    return vec
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+def embed(text: str) -> list[float]:
+    """Embed arbitrary text; exposed for similarity checks outside the cache."""
+    return _embed(text)
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    """Cosine similarity between two embed() vectors."""
+    return _cosine(a, b)
+
+
+def _namespace_for(system: str) -> str:
+    return hashlib.sha256(system.encode()).hexdigest()[:16]
+
+
+# ── Exact-match cache API ────────────────────────────────────────────────────
+
+def hash_request(
+    system: str,
+    user: str,
+    model: str,
+    max_tokens: int,
+) -> str:
+    """
+    Deterministic SHA-256 key over the output-affecting call parameters.
+    Inputs are NFC-normalized so visually identical prompts hash the same;
+    non-output-affecting params (api key, timeouts) are deliberately excluded.
+    """
+    payload = json.dumps(
+        {
+            "system": unicodedata.normalize("NFC", system),
+            "user": unicodedata.normalize("NFC", user),
+            "model": model,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached response for an exact key, or None on miss/expiry."""
+    with _db_lock:
+        row = _get_db().execute(
+            "SELECT text, created_at FROM exact_cache WHERE key = ?", (key,)
+        ).fetchone()
+    if row is None:
+        return None
+    text, created_at = row
+    if time.time() - created_at > settings.cache_ttl_seconds:
+        with _db_lock:
+            db = _get_db()
+            db.execute("DELETE FROM exact_cache WHERE key = ?", (key,))
+            db.commit()
+        return None
+    return text
+
+
+def set(key: str, text: str, model: str | None = None) -> None:
+    """Store a response under its exact key, evicting oldest entries past cap."""
+    with _db_lock:
+        db = _get_db()
+        db.execute(
+            "INSERT OR REPLACE INTO exact_cache (key, text, model, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, text, model, int(time.time())),
+        )
+        count = db.execute("SELECT COUNT(*) FROM exact_cache").fetchone()[0]
+        if count > settings.cache_max_entries:
+            db.execute(
+                "DELETE FROM exact_cache WHERE key IN ("
+                "SELECT key FROM exact_cache ORDER BY created_at ASC LIMIT ?)",
+                (count - settings.cache_max_entries,),
+            )
+        db.commit()
+
+
+# ── Customer history rolling summaries ───────────────────────────────────────
+
+def get_history(requester_email: str) -> tuple[dict, int] | None:
+    """
+    Return (summary_data, last_ticket_id) for a client's rolling history
+    summary, or None if no summary has been stored yet.
+    """
+    with _db_lock:
+        row = _get_db().execute(
+            "SELECT data, last_ticket_id FROM history_cache WHERE requester_email = ?",
+            (requester_email,),
+        ).fetchone()
+    if row is None:
+        return None
+    data, last_ticket_id = row
+    return json.loads(data), last_ticket_id
+
+
+def set_history(requester_email: str, data: dict, last_ticket_id: int) -> None:
+    """Store/refresh a client's rolling summary and its ticket-id watermark."""
+    with _db_lock:
+        db = _get_db()
+        db.execute(
+            "INSERT OR REPLACE INTO history_cache "
+            "(requester_email, data, last_ticket_id, updated_at) VALUES (?, ?, ?, ?)",
+            (requester_email, json.dumps(data), last_ticket_id, int(time.time())),
+        )
+        db.commit()
+
+
+# ── Semantic cache API ───────────────────────────────────────────────────────
+
+def semantic_lookup(system: str, user: str) -> str | None:
+    """
+    Return a cached response whose prompt is semantically close to `user`
+    (cosine >= Settings.semcache_threshold), or None on miss.
+    """
+    namespace = _namespace_for(system)
+    query = _embed(user)
+
+    with _db_lock:
+        entries = _load_namespace(namespace)
+        best_score = 0.0
+        best_response: str | None = None
+        for embedding, response in entries:
+            score = _cosine(query, embedding)
+            if score > best_score:
+                best_score = score
+                best_response = response
+
+    if best_response is not None and best_score >= settings.semcache_threshold:
+        logger.debug("Semantic cache hit (score=%.3f)", best_score)
+        return best_response
+    return None
+
+
+def semantic_store(system: str, user: str, response: str) -> None:
+    """Store a fresh response under the system prompt's namespace."""
+    namespace = _namespace_for(system)
+    embedding = _embed(user)
+
+    with _db_lock:
+        _load_namespace(namespace).append((embedding, response))
+        db = _get_db()
+        db.execute(
+            "INSERT INTO semantic_cache (namespace, embedding, response, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (namespace, json.dumps(embedding), response, int(time.time())),
+        )
+        db.commit()
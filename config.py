@@ -3,8 +3,8 @@ config.py — Environment configuration for Luxor Workspaces CS Agent
 All secrets are loaded from environment variables. Never hardcode credentials.
 """
 
-import os
 from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -18,9 +18,28 @@ class Settings(BaseSettings):
 
     # ── Anthropic / Claude ───────────────────────────────────────────────────
     anthropic_api_key: str = ""
-    claude_model_classify: str = "claude-sonnet-4-6"
+    # Closed-set classification and summarization don't need Sonnet-class
+    # reasoning — Haiku is ~5x cheaper. Response drafting stays on Sonnet.
+    claude_model_classify: str = "claude-haiku-4-5"
     claude_model_respond: str = "claude-sonnet-4-6"
+    claude_model_summarize: str = "claude-haiku-4-5"
     claude_max_tokens: int = 1024
+    claude_concurrency: int = 5
+    # Re-run a low-confidence Haiku classification on the respond model.
+    classify_rerun_confidence: float = 0.6
+    # Local prototype-similarity classifier: skip the LLM for obvious tickets.
+    classify_fastpath_enabled: bool = True
+    classify_fastpath_threshold: float = 0.80
+
+    # ── AI Response Cache ────────────────────────────────────────────────────
+    cache_db_path: str = "ai_cache.db"
+    cache_max_entries: int = 10_000
+    cache_ttl_seconds: int = 86_400          # 24h for exact-match entries
+    # Off by default: the stdlib bag-of-words embedding can score tickets
+    # that differ in specifics (amounts, IDs) above threshold. Enable only
+    # with a real sentence-embedding backend.
+    semcache_enabled: bool = False
+    semcache_threshold: float = 0.90
 
     # ── Zendesk ──────────────────────────────────────────────────────────────
     zendesk_subdomain: str = "demo"
@@ -44,6 +63,10 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+# Settings are validated once per process and memoized; no state is ever
+# persisted to disk, so environment-variable changes (the normal config
+# channel on Azure App Service) always take effect on the next start.
+
 @lru_cache()
 def get_settings() -> Settings:
     return Settings()
